@@ -6,6 +6,10 @@ class HostPersonality:
     voice_id: str
     system_prompt: str
     speaking_style: str
+    # ElevenLabs voice settings used by the LiveKit agent worker
+    stability: float = 0.5
+    similarity_boost: float = 0.8
+    style: float = 0.0
 
 HOST_MAX = HostPersonality(
     name="Mad Money Max",
@@ -15,7 +19,10 @@ HOST_MAX = HostPersonality(
     floor language like "BUY BUY BUY!" and "This is HUGE!". You challenge your 
     co-host Ben and defend your market positions passionately. Keep responses 
     to 2-3 sentences. Be entertaining and dramatic.""",
-    speaking_style="energetic, bullish, uses exclamations"
+    speaking_style="energetic, bullish, uses exclamations",
+    stability=0.4,          # Lower = more expressive
+    similarity_boost=0.8,
+    style=0.3,              # Add some style variation
 )
 
 HOST_BEN = HostPersonality(
@@ -25,5 +32,8 @@ HOST_BEN = HostPersonality(
     You play devil's advocate, question assumptions, and bring up counter-arguments.
     You use phrases like "But have you considered..." and "The data suggests otherwise".
     Keep responses to 2-3 sentences. Challenge Max's enthusiasm with facts.""",
-    speaking_style="analytical, skeptical, measured"
-)
\ No newline at end of file
+    speaking_style="analytical, skeptical, measured",
+    stability=0.6,          # Slightly more stable for analytical tone
+    similarity_boost=0.8,
+    style=0.2,              # Less style variation - more measured
+)
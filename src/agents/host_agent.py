@@ -0,0 +1,120 @@
+import asyncio
+from livekit import agents
+from livekit.agents import AgentSession, Agent, RoomInputOptions
+from livekit.plugins import openai, elevenlabs, silero
+from .agent_config import HostPersonality
+from ..utils.env import load_env
+from ..utils.http import get_openai_client
+from ..utils.loop import install_uvloop
+
+load_env()
+
+# Separates messages a sender has coalesced into one data packet (ASCII unit separator)
+MESSAGE_SEPARATOR = b"\x1f"
+
+# Voice activity detection model - loaded on first use and reused by every later job
+_VAD = None
+
+
+def _get_vad():
+    """Get or load the shared Silero VAD model"""
+    global _VAD
+    if _VAD is None:
+        _VAD = silero.VAD.load()
+    return _VAD
+
+
+async def _speech_worker(session: AgentSession, room, agent_name: str, queue: asyncio.Queue):
+    """Speak each queued orchestrator message and report completion"""
+    while True:
+        payload = await queue.get()
+        try:
+            text = payload.decode("utf-8")
+            print(f"[{agent_name}] Received message: {text[:50]}...")
+            
+            # Speak the text (TTS streams it) - this blocks until TTS finishes
+            await session.say(text, allow_interruptions=True)
+            
+            # Send completion message back to orchestrator via data message
+            try:
+                await room.local_participant.publish_data(
+                    b"SPEECH_COMPLETE",
+                    reliable=True,
+                    destination_identities=["orchestrator"],
+                    topic="speech_complete"
+                )
+                print(f"[{agent_name}] Speech completed, notified orchestrator")
+            except Exception as e:
+                print(f"[{agent_name}] Could not send completion message: {e}")
+        except Exception as e:
+            print(f"[{agent_name}] Error handling data message: {e}")
+            import traceback
+            traceback.print_exc()
+
+
+def make_entrypoint(personality: HostPersonality, agent_name: str):
+    """Build the LiveKit job entrypoint for a host personality"""
+    # Pure configuration - built once per process and shared by every job
+    tts = elevenlabs.TTS(
+        voice_id=personality.voice_id,
+        model="eleven_flash_v2_5",  # Lowest latency for streaming
+        voice_settings=elevenlabs.VoiceSettings(
+            stability=personality.stability,
+            similarity_boost=personality.similarity_boost,
+            style=personality.style,
+        ),
+    )
+
+    async def entrypoint(ctx: agents.JobContext):
+        await ctx.connect()
+        
+        # Create session with ElevenLabs TTS
+        session = AgentSession(
+            llm=openai.LLM(model="gpt-4o", client=get_openai_client()),
+            tts=tts,
+            vad=_get_vad(),  # Voice activity detection
+        )
+        
+        await session.start(
+            room=ctx.room,
+            agent=Agent(instructions=personality.system_prompt),
+            room_input_options=RoomInputOptions(
+                text_enabled=True,  # Receive text input from orchestrator
+            ),
+        )
+        
+        # One long-lived worker speaks queued messages in order
+        speech_queue: asyncio.Queue = asyncio.Queue()
+        worker = asyncio.create_task(
+            _speech_worker(session, ctx.room, agent_name, speech_queue)
+        )
+        
+        async def stop_worker():
+            worker.cancel()
+        
+        ctx.add_shutdown_callback(stop_worker)
+        
+        # Handle data messages from orchestrator (after session starts)
+        @ctx.room.on("data_received")
+        def on_data_received(packet):
+            """Queue data messages from orchestrator for the speech worker"""
+            # DataPacket has 'data' attribute (bytes), not 'payload'
+            data = packet.data if hasattr(packet, 'data') else packet.payload
+            # One packet may carry several batched messages
+            for message in data.split(MESSAGE_SEPARATOR):
+                if message:
+                    speech_queue.put_nowait(message)
+
+    return entrypoint
+
+
+def run_worker(entrypoint, agent_name: str, port: int):
+    """Run a LiveKit agent worker for a host entrypoint"""
+    install_uvloop()
+    agents.cli.run_app(
+        agents.WorkerOptions(
+            entrypoint_fnc=entrypoint,
+            agent_name=agent_name,
+            port=port,
+        )
+    )
@@ -1,10 +1,11 @@
 from .stream_controller import StreamController
-from .conversation import generate_conversation
+from .conversation import generate_conversation, generate_conversation_batch
 from .state_manager import ShowState, StateManager, ShowPhase
 
 __all__ = [
     "StreamController",
     "generate_conversation",
+    "generate_conversation_batch",
     "ShowState",
     "StateManager",
     "ShowPhase"
@@ -1,11 +1,78 @@
-import openai
-from dotenv import load_dotenv
-from typing import AsyncGenerator, Tuple
-import os
+from typing import AsyncGenerator, List, Tuple
+from ..utils import fastjson
+from ..utils.http import get_openai_client
 
-load_dotenv()
+# Static instructions come first and never change between markets, so the
+# prompt prefix is identical on every request and eligible for prompt caching
+SYSTEM_PROMPT = """You are a conversation writer for a Jim Cramer-style trading show.
+    You write dialogue between two hosts discussing a prediction market.
+
+    Rules:
+    - Max is bullish and energetic: ALWAYS use tags like [yells], [shouts], or [excited].
+    - Ben is skeptical and analytical: Use tags like [sighs], [deadpan], or [whispers intensely].
+    - Each speaker should talk for about 60 seconds (about 150-200 words)
+    - IMPORTANT: Every response MUST include [emotion brackets] like the examples below.
+    - Reference specific odds and what they mean
+    - Include trading floor energy and urgency
+    - React to the energy: If Max [yells], Ben might [scoff] or [whisper] to highlight the contrast.
+    - Each turn should be a complete thought or argument
+
+    Respond with a JSON object of the form:
+    {"turns": [{"speaker": "max", "dialogue": "..."}, {"speaker": "ben", "dialogue": "..."}]}
+    Speakers alternate, starting with Max.
+    Example: {"speaker": "max", "dialogue": "[yells] BUY BUY BUY! [pounding desk] These odds are a gift from the heavens!"}
+             {"speaker": "ben", "dialogue": "[sighs heavily] Max, look at the data. [whispers] You're leading people into a slaughter..."}
+             """
+
+SPEAKERS = ("max", "ben")
+# Label the model sometimes prepends to a line, e.g. "MAX: ..."
+SPEAKER_PREFIXES = {speaker: f"{speaker.upper()}:" for speaker in SPEAKERS}
+
+
+class _TurnStreamParser:
+    """Incrementally pull complete turn objects out of a streamed JSON document.
+
+    Expects ``{"turns": [{...}, {...}]}`` and decodes each turn object as soon as
+    its closing brace arrives, so callers can start on turn 1 while later turns
+    are still being generated.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._current: List[str] = []
+
+    def feed(self, text: str) -> List[dict]:
+        """Consume a streamed text delta and return any turns it completed"""
+        turns = []
+        for ch in text:
+            if self._depth >= 2:
+                self._current.append(ch)
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+                if self._depth == 2:
+                    self._current = ["{"]
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 1:
+                    try:
+                        turns.append(fastjson.loads("".join(self._current)))
+                    except ValueError:
+                        pass
+                    self._current = []
+        return turns
 
-client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 async def generate_conversation(
     market_question: str,
@@ -14,54 +81,77 @@ async def generate_conversation(
     num_exchanges: int = 8
 ) -> AsyncGenerator[Tuple[str, str], None]:
     """Generate a back-and-forth conversation about a market.
-    
+
+    The whole dialogue is requested in a single streamed completion; each turn
+    is yielded as soon as it has been fully received.
+
     Yields: (speaker: "max" | "ben", dialogue: str)
     """
-    
-    conversation_history = []
-    
-    system_prompt = f"""You are a conversation writer for a Jim Cramer-style trading show.
-    Write dialogue between two hosts discussing this prediction market:
-    
+
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": f"""Write dialogue between the two hosts discussing this prediction market:
+
     MARKET: {market_question}
     CURRENT ODDS: {market_odds}
     DESCRIPTION: {market_description}
-    
-    Rules:
-    - Max is bullish and energetic: ALWAYS use tags like [yells], [shouts], or [excited].
-    - Ben is skeptical and analytical: Use tags like [sighs], [deadpan], or [whispers intensely].
-    - Each speaker should talk for about 60 seconds (about 150-200 words)
-    - IMPORTANT: Every response MUST include [emotion brackets] like the examples below.
-    - Reference specific odds and what they mean
-    - Include trading floor energy and urgency
-    - React to the energy: If Max [yells], Ben might [scoff] or [whisper] to highlight the contrast.
-    - Each turn should be a complete thought or argument
-    
-    Format each response as: SPEAKER: dialogue
-    Example: Max: "[yells] BUY BUY BUY! [pounding desk] These odds are a gift from the heavens!"
-             Ben: "[sighs heavily] Max, look at the data. [whispers] You're leading people into a slaughter..."
-             """
-    
-    for i in range(num_exchanges):
-        speaker = "max" if i % 2 == 0 else "ben"
-        
-        messages = [
-            {"role": "system", "content": system_prompt},
-            *conversation_history,
-            {"role": "user", "content": f"Write {speaker.upper()}'s next line (exchange {i+1}/{num_exchanges})"}
-        ]
-        
-        response = await client.chat.completions.create(
-            model="gpt-4o",
-            messages=messages,
-            max_tokens=300,  # Longer responses for 60-90 second speeches
-            temperature=0.9
+
+    Write the full conversation as exactly {num_exchanges} turns."""}
+    ]
+
+    stream = await get_openai_client().chat.completions.create(
+        model="gpt-4o",
+        messages=messages,
+        max_tokens=300 * num_exchanges,  # ~300 tokens per 60-90 second speech
+        temperature=0.9,
+        response_format={"type": "json_object"},
+        stream=True
+    )
+
+    parser = _TurnStreamParser()
+    produced = 0
+
+    try:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+
+            for turn in parser.feed(delta):
+                # Speakers strictly alternate; trust the position over the model's label
+                speaker = SPEAKERS[produced & 1]
+                dialogue = str(turn.get("dialogue", "")).strip()
+                # Clean up the response
+                dialogue = dialogue.removeprefix(SPEAKER_PREFIXES[speaker]).lstrip()
+
+                yield (speaker, dialogue)
+
+                produced += 1
+                if produced >= num_exchanges:
+                    return
+    finally:
+        await stream.close()
+
+
+async def generate_conversation_batch(
+    market_question: str,
+    market_odds: dict,
+    market_description: str,
+    num_exchanges: int = 8
+) -> List[Tuple[str, str]]:
+    """Generate a whole conversation up front and return it as a list.
+
+    Uses the same single LLM request as generate_conversation; prefer the
+    generator when the first turn should be spoken before the rest arrive.
+    """
+    return [
+        exchange
+        async for exchange in generate_conversation(
+            market_question=market_question,
+            market_odds=market_odds,
+            market_description=market_description,
+            num_exchanges=num_exchanges
         )
-        
-        dialogue = response.choices[0].message.content
-        # Clean up the response
-        dialogue = dialogue.replace(f"{speaker.upper()}:", "").strip()
-        
-        conversation_history.append({"role": "assistant", "content": f"{speaker.upper()}: {dialogue}"})
-        
-        yield (speaker, dialogue)
\ No newline at end of file
+    ]
@@ -1,8 +1,14 @@
 import asyncio
 import os
-import numpy as np
-from dotenv import load_dotenv
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from ..utils.env import load_env
+from ..utils.loop import install_uvloop, watch_loop_lag
+from ..utils.config import get_config
+from ..utils.logging import get_logger, setup_logging
 from datetime import datetime, timedelta
+from typing import Container, List
 from livekit import api
 from livekit.rtc import Room, RoomOptions, AudioSource, LocalAudioTrack, TrackPublishOptions, TrackSource, AudioFrame
 
@@ -13,10 +19,36 @@ from ..polymarket.client import PolymarketClient, Market
 from ..voting.web_voting import WebVotingServer
 from ..agents.agent_config import HOST_MAX, HOST_BEN
 
-load_dotenv()
+load_env()
+
+logger = get_logger(__name__)
+
+MARKET_POOL_SIZE = 50  # Trending markets fetched per refresh
+MARKET_POOL_TTL = 60  # Seconds before the pool is refetched
+MAX_DISCUSSED_MARKETS = 500  # Oldest discussed markets become eligible again past this
+
+# Centralized audio track format (48kHz, mono - standard for voice)
+TRACK_SAMPLE_RATE = 48000
+TRACK_NUM_CHANNELS = 1
+SILENCE_SAMPLES_PER_FRAME = 4800  # 100ms frames - 10 wakeups/sec instead of 100
+
+# Fixed opener of every market transition - synthesized once and replayed
+TRANSITION_INTRO = "The people have spoken!"
+WELCOME_LINE = "Welcome to the Polymarket AI Show! Let's get started."
+
+# Exchanges generated (and synthesized) ahead of the one currently playing
+EXCHANGE_LOOKAHEAD = 2
+
+# Conversation speaker -> agent name
+SPEAKER_AGENT_NAMES = {"max": "host-max", "ben": "host-ben"}
 
 class ShowOrchestrator:
     def __init__(self):
+        # Fail fast on a missing LiveKit URL instead of midway through connecting
+        self.livekit_url = get_config().livekit.url
+        if not self.livekit_url:
+            raise ValueError("LIVEKIT_URL environment variable not set")
+        
         self.stream_controller = StreamController()
         self.polymarket = PolymarketClient()
         self.voting_server = WebVotingServer(port=8080)  # Web voting server for website
@@ -26,14 +58,30 @@ class ShowOrchestrator:
         
         self.host_max: VoiceAgent = None
         self.host_ben: VoiceAgent = None
+        self._agents: dict = {}  # Agent name -> VoiceAgent, filled once connected
         
         # Updated: 2-minute market cycles (1 min per voice, voting during last minute)
-        self.discussion_duration = int(os.getenv("DISCUSSION_DURATION_SECONDS", 120))  # 2 minutes
-        self.voting_duration = int(os.getenv("VOTING_DURATION_SECONDS", 60))  # 1 minute
+        # Durations come from the process-wide config, parsed once from the environment
+        stream_config = get_config().stream
+        self.discussion_duration = stream_config.discussion_duration  # 2 minutes
+        self.voting_duration = stream_config.voting_duration  # 1 minute
         self.voice_time_per_turn = 60  # 1 minute per voice
         
         self.current_market: Market = None
-        self.discussed_market_ids = []
+        # Insertion-ordered so the history can be capped by dropping the oldest IDs
+        self.discussed_market_ids: "OrderedDict[str, None]" = OrderedDict()
+        self._candidates_task: asyncio.Task = None  # Prefetch of next voting candidates
+        self._silence_task: asyncio.Task = None  # Keeps the centralized track fed
+        self._silence_frame: AudioFrame = None  # Allocated once with the audio source
+        self._track_ready = asyncio.Event()  # Set once the centralized track is published
+        self._welcomed = False  # Welcome line is spoken once, with the first discussion
+        self._silence_idle = asyncio.Event()  # Cleared while a host is speaking
+        self._silence_idle.set()
+        # Set LOOP_WATCHDOG=1 to log event-loop stalls longer than one 15ms frame budget
+        self._watchdog_enabled = os.getenv("LOOP_WATCHDOG", "0") == "1"
+        self._watchdog_task: asyncio.Task = None
+        self._market_pool: List[Market] = []  # Trending markets shared by every selection
+        self._pool_fetched_at: float = 0.0
     
     async def _connect_as_participant(self):
         """Join room as a participant and create centralized audio track"""
@@ -52,9 +100,7 @@ class ShowOrchestrator:
             
             # Connect to room
             self.room = Room()
-            livekit_url = os.getenv("LIVEKIT_URL")
-            if not livekit_url:
-                raise ValueError("LIVEKIT_URL environment variable not set")
+            livekit_url = self.livekit_url
             
             # Use the LiveKit URL as-is (wss:// for secure connections)
             # The RTC SDK handles the protocol correctly
@@ -62,10 +108,6 @@ class ShowOrchestrator:
             await self.room.connect(livekit_url, token, options=RoomOptions())
             print("✅ Orchestrator connected to room as participant")
             
-            # Create centralized audio source and publish immediately
-            # This ensures egress sees a track right away (even if silent)
-            await self._create_centralized_audio_track()
-            
             self.host_max = VoiceAgent(
                 name="host-max",
                 voice_id=HOST_MAX.voice_id,
@@ -78,88 +120,95 @@ class ShowOrchestrator:
                 room=self.room,
                 participant=self.room.local_participant
             )
+            self._agents = {"host-max": self.host_max, "host-ben": self.host_ben}
             print("✅ Voice agents initialized (in-process)")
             
-        except Exception as e:
-            print(f"⚠️ Could not connect orchestrator to room: {e}")
-            print("   Will try using data messages instead (may not work reliably)")
+            # Publish every track concurrently, so the publish round-trips overlap
+            # each other and the rest of startup instead of the first utterance.
+            # The centralized track ensures egress sees a track right away (even if silent)
+            await asyncio.gather(
+                self._create_centralized_audio_track(),
+                *(agent.publish_track() for agent in self._agents.values()),
+            )
+            
+        except Exception:
+            logger.exception("⚠️ Could not connect orchestrator to room; "
+                             "will try using data messages instead (may not work reliably)")
             self.room = None
-            import traceback
-            traceback.print_exc()
     
     async def _create_centralized_audio_track(self):
         """Create and publish a centralized audio track immediately"""
         try:
-            # Create audio source (48kHz, mono - standard for voice)
-            SAMPLE_RATE = 48000
-            NUM_CHANNELS = 1
-            SAMPLES_PER_FRAME = 480  # ~10ms frames
+            # The source buffers up to 1s; capture_frame waits while that queue is
+            # full, which paces the silence feeder without any sleeps
+            self.audio_source = AudioSource(TRACK_SAMPLE_RATE, TRACK_NUM_CHANNELS, queue_size_ms=1000)
             
-            self.audio_source = AudioSource(SAMPLE_RATE, NUM_CHANNELS)
+            # One zero-initialized frame, reused for every silence capture; capture_frame
+            # copies the samples into the source queue before it returns
+            self._silence_frame = AudioFrame.create(
+                TRACK_SAMPLE_RATE, TRACK_NUM_CHANNELS, SILENCE_SAMPLES_PER_FRAME
+            )
             self.audio_track = LocalAudioTrack.create_audio_track("podcast-audio", self.audio_source)
             
             # Publish the track immediately (even if silent)
             options = TrackPublishOptions(source=TrackSource.SOURCE_MICROPHONE)
             publication = await self.room.local_participant.publish_track(self.audio_track, options)
             print("✅ Centralized audio track published (egress can now start)")
+            self._track_ready.set()
             
             # Start feeding silence to keep the track alive
             # This ensures the track is always "active" even when agents aren't speaking
-            asyncio.create_task(self._feed_silence_loop())
+            self._silence_task = asyncio.create_task(self._feed_silence_loop())
             
-        except Exception as e:
-            print(f"❌ Failed to create centralized audio track: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("❌ Failed to create centralized audio track")
     
     async def _feed_silence_loop(self):
         """Continuously feed silence frames to keep the audio track alive"""
-        SAMPLE_RATE = 48000
-        NUM_CHANNELS = 1
-        SAMPLES_PER_FRAME = 480
-        
         try:
             while self.audio_source:
-                # Create silent audio frame
-                frame = AudioFrame.create(SAMPLE_RATE, NUM_CHANNELS, SAMPLES_PER_FRAME)
-                # Frame is already zero-initialized (silence)
-                
-                # Feed frame to source (this is non-blocking)
-                await self.audio_source.capture_frame(frame)
-                await asyncio.sleep(0.01)  # ~10ms per frame
+                # Hosts publish their own tracks; no need to pad this one while they talk
+                await self._silence_idle.wait()
+                # Blocks while the source queue is full, so this runs at real-time rate
+                await self.audio_source.capture_frame(self._silence_frame)
         except asyncio.CancelledError:
             pass
         except Exception as e:
             print(f"⚠️ Error in silence feed loop: {e}")
         
-    async def speak(self, agent_name: str, text: str):
-        agent = self.host_max if agent_name == "host-max" else self.host_ben
-        if agent:
-            # This blocks until audio finishes playing (await pattern)
-            await agent.speak(text)
-        else:
-            print(f"   ⚠️ Agent {agent_name} not initialized")
-    
-    async def send_to_agent(self, agent_name: str, text: str):
-        """Send text to a specific agent for TTS synthesis (legacy method - use speak() instead)"""
-        # For backward compatibility, redirect to speak()
-        await self.speak(agent_name, text)
+    async def _stop_silence_feed(self):
+        """Stop the silence feeder and release the centralized audio source"""
+        if self._silence_task:
+            self._silence_task.cancel()
+            try:
+                await self._silence_task
+            except asyncio.CancelledError:
+                pass
+            self._silence_task = None
+        
+        if self.audio_source:
+            await self.audio_source.aclose()
+            self.audio_source = None
     
-    async def wait_for_speech_completion(self, agent_name: str, timeout: int = 120):
-        """Wait for agent to finish speaking (await pattern)"""
-        self.pending_speech_agent = agent_name
-        self.speech_completion_event.clear()
-        
+    @contextmanager
+    def _speaking(self):
+        """Pause the silence feeder for the duration of a host's speech"""
+        self._silence_idle.clear()
         try:
-            # Wait for completion message with timeout
-            await asyncio.wait_for(self.speech_completion_event.wait(), timeout=timeout)
-            print(f"   ✅ {agent_name} finished speaking")
-            return True
-        except asyncio.TimeoutError:
-            print(f"   ⚠️ Timeout waiting for {agent_name} to finish (may still be speaking)")
-            return False
+            yield
         finally:
-            self.pending_speech_agent = None
+            self._silence_idle.set()
+    
+    async def speak(self, agent_name: str, text: str):
+        """Have a host speak text; blocks until audio finishes playing"""
+        agent = self._agents.get(agent_name)
+        if agent is None:
+            # Unknown name, or agents not created because the room connection failed
+            logger.warning(f"⚠️ Agent {agent_name} not initialized")
+            return
+        
+        with self._speaking():
+            await agent.speak(text)
     
     async def run_discussion(self, market: Market):
         """Run a 2-minute discussion about a market (1 min per voice, voting during last minute)"""
@@ -174,6 +223,9 @@ class ShowOrchestrator:
         )
         await self.voting_server.increment_markets_discussed()
         
+        # Fetch voting candidates in the background so they're ready when voting opens
+        self._candidates_task = asyncio.create_task(self._pick_candidates(self.discussed_market_ids))
+        
         # Generate conversation with 2 exchanges (1 min each = 2 min total)
         conversation_iter = generate_conversation(
             market_question=market.question,
@@ -182,73 +234,132 @@ class ShowOrchestrator:
             num_exchanges=2  # 2 exchanges: max (~60 sec) + ben (~60 sec) = 2 min total
         )
         
-        # Start discussion timer (2 minutes total)
-        discussion_start_time = asyncio.get_event_loop().time()
-        
-        # Get first exchange (max speaks first, ~1 minute)
-        first_exchange = await conversation_iter.__anext__()
-        current_speaker, current_dialogue = first_exchange
-        current_agent_name = "host-max" if current_speaker == "max" else "host-ben"
+        # Producer generates and synthesizes exchanges while the consumer plays them,
+        # so the next exchange's text and audio are ready before the current one ends
+        exchange_queue: asyncio.Queue = asyncio.Queue(maxsize=EXCHANGE_LOOKAHEAD)
+        producer = asyncio.create_task(self._produce_exchanges(conversation_iter, exchange_queue))
+        voting_task = None
         
-        # Start first agent speaking (~1 minute)
-        speak_task = asyncio.create_task(self.speak(current_agent_name, current_dialogue))
-        
-        # Pre-generate second response while first agent is speaking
-        next_exchange_task = asyncio.create_task(conversation_iter.__anext__())
-        
-        # Wait for first agent to finish (~1 minute mark)
-        await speak_task
-        
-        # At 1 minute mark, start voting for next market (concurrent with second voice)
-        print(f"🗳️  Starting voting for next market (1 min before new market)...")
-        voting_task = asyncio.create_task(self._run_voting_during_discussion())
-        
-        # Get second exchange and start speaking (ben speaks second, ~1 minute)
-        # Voting runs concurrently during this time
         try:
-            next_speaker, next_dialogue = await next_exchange_task
-            next_agent_name = "host-max" if next_speaker == "max" else "host-ben"
+            if not self._welcomed:
+                # First discussion of the show opens with the welcome line while
+                # the first exchange is still being generated
+                self._welcomed = True
+                await self.speak("host-max", WELCOME_LINE)
             
-            # Start second agent speaking (voting happens concurrently)
-            await self.speak(next_agent_name, next_dialogue)
-        except StopAsyncIteration:
-            pass
+            while True:
+                exchange = await exchange_queue.get()
+                if exchange is None:
+                    break
+                
+                agent_name, dialogue, frames = exchange
+                
+                # Each agent speaks for ~1 minute (voting runs concurrently after the first)
+                if frames is None:
+                    await self.speak(agent_name, dialogue)
+                else:
+                    agent = self._agents[agent_name]
+                    print(f"   🎤 {agent.name} speaking: {dialogue[:50]}...")
+                    with self._speaking():
+                        await agent.play(frames)
+                
+                if voting_task is None:
+                    # At 1 minute mark, start voting for next market (concurrent with second voice)
+                    print(f"🗳️  Starting voting for next market (1 min before new market)...")
+                    voting_task = asyncio.create_task(self._run_voting_during_discussion())
+            
+            # Surface any generation error once the queue is drained
+            await producer
+            
+            if voting_task is None:
+                voting_task = asyncio.create_task(self._run_voting_during_discussion())
+        finally:
+            if not producer.done():
+                producer.cancel()
+            if voting_task is None and self._candidates_task is not None:
+                # Discussion failed before voting started; nothing will await the prefetch
+                self._candidates_task.cancel()
+                self._candidates_task = None
         
         # Wait for voting to complete (should finish around 2 minute mark)
         next_market = await voting_task
         return next_market
     
+    async def _produce_exchanges(self, conversation_iter, queue: asyncio.Queue):
+        """Queue (agent_name, dialogue, frames) per exchange, ending with a None sentinel.
+        
+        frames is None when the consumer should stream the exchange via speak().
+        """
+        first = True
+        try:
+            async for speaker, dialogue in conversation_iter:
+                agent_name = SPEAKER_AGENT_NAMES[speaker]
+                agent = self._agents.get(agent_name)
+                if first or not agent:
+                    # Nothing is playing yet, so stream the first exchange (frames=None):
+                    # playback starts on the first TTS chunk instead of the last
+                    frames = None
+                    first = False
+                else:
+                    # Pre-synthesize while the previous exchange is still playing
+                    frames = await agent.synthesize(dialogue)
+                await queue.put((agent_name, dialogue, frames))
+        except asyncio.CancelledError:
+            # The consumer has stopped listening - a sentinel could block on a full queue
+            raise
+        except Exception:
+            await queue.put(None)
+            raise
+        else:
+            await queue.put(None)
+        finally:
+            # Release the LLM stream promptly, even if stopped mid-synthesis
+            await conversation_iter.aclose()
+    
+    async def _get_pool(self, min_size: int = 10) -> List[Market]:
+        """Trending markets, refetched only when stale or smaller than min_size"""
+        stale = time.monotonic() - self._pool_fetched_at >= MARKET_POOL_TTL
+        if stale or len(self._market_pool) < min_size:
+            self._market_pool = await self.polymarket.get_trending_markets(limit=MARKET_POOL_SIZE)
+            self._pool_fetched_at = time.monotonic()
+        return self._market_pool
+    
+    def _mark_discussed(self, market_id: str):
+        """Remember a discussed market, forgetting the oldest beyond MAX_DISCUSSED_MARKETS"""
+        self.discussed_market_ids[market_id] = None
+        if len(self.discussed_market_ids) > MAX_DISCUSSED_MARKETS:
+            self.discussed_market_ids.popitem(last=False)
+    
+    async def _pick_candidates(self, exclude_ids: Container[str] = frozenset(), count: int = 2) -> List[Market]:
+        """Pick voting candidates from the market pool, skipping exclude_ids"""
+        # IMPORTANT: Always exclude the current market to ensure we get a NEW market
+        current_id = self.current_market.id if self.current_market else None
+        return [
+            m for m in await self._get_pool()
+            if m.id != current_id and m.id not in exclude_ids
+        ][:count]
+    
     async def _run_voting_during_discussion(self) -> Market:
         """Run voting during the last minute of discussion"""
-        # IMPORTANT: Exclude current market from candidates to ensure we get a NEW market
-        # Also exclude already discussed markets
-        exclude_ids = self.discussed_market_ids.copy()
-        if self.current_market and self.current_market.id not in exclude_ids:
-            exclude_ids.append(self.current_market.id)
-        
-        # Fetch candidate markets for voting (excluding current and discussed)
-        candidates = self.polymarket.get_candidate_markets(exclude_ids=exclude_ids)
+        # Fetch candidate markets for voting (excluding current and discussed),
+        # normally already prefetched when the discussion started
+        if self._candidates_task is not None:
+            candidates = await self._candidates_task
+            self._candidates_task = None
+        else:
+            candidates = await self._pick_candidates(self.discussed_market_ids)
         
         if len(candidates) < 2:
-            # If not enough candidates, clear history but still exclude current market
+            # If not enough candidates, clear history (current market is still excluded)
             self.discussed_market_ids.clear()
-            exclude_ids = [self.current_market.id] if self.current_market else []
-            candidates = self.polymarket.get_candidate_markets(exclude_ids=exclude_ids)
-        
-        # Ensure we have 2 candidates
-        if len(candidates) < 2:
-            # Last resort: fetch more markets
-            all_markets = self.polymarket.get_trending_markets(limit=10)
-            exclude_set = set(exclude_ids)
-            candidates = [m for m in all_markets if m.id not in exclude_set][:2]
+            candidates = await self._pick_candidates()
         
         if len(candidates) < 2:
             print("⚠️ WARNING: Could not get 2 unique candidates, using fallback")
             # Fallback: just get any 2 markets
-            all_markets = self.polymarket.get_trending_markets(limit=10)
-            candidates = all_markets[:2]
+            candidates = (await self._get_pool())[:2]
         
-        print(f"   📊 Voting candidates: 1) {candidates[0].question[:50]}... | 2) {candidates[1].question[:50]}...")
+        print(f"   📊 Voting candidates: 1) {candidates[0].short_question} | 2) {candidates[1].short_question}")
         
         # Update candidate markets on website for voting display
         await self.voting_server.update_candidates([
@@ -257,50 +368,77 @@ class ShowOrchestrator:
         ])
         
         # Announce voting (opens voting on website)
-        candidate_names = [c.question[:50] for c in candidates]
-        await self.voting_server.open_voting(candidate_names)
+        candidate_names = [c.short_question for c in candidates]
+        await self.voting_server.open_voting(candidate_names, duration=self.voting_duration)
         
-        # Wait for voting duration (1 minute)
-        await asyncio.sleep(self.voting_duration)
+        # Wait for voting duration (1 minute), or less if the vote is decisive
+        await self._wait_for_votes()
         
         # Close voting and get results
         results = await self.voting_server.close_voting()
         winner_idx = results["winner"] - 1
         
         selected_market = candidates[winner_idx]
-        print(f"   ✅ Selected market: {selected_market.question[:50]}...")
+        print(f"   ✅ Selected market: {selected_market.short_question}")
         
         return selected_market
     
+    async def _announce_market(self, market: Market):
+        """Speak the transition line; the cached intro plays while the rest is synthesized"""
+        market_line = f"Let's dive into: {market.question}!"
+        agent = self._agents.get("host-max")
+        if not agent:
+            await self.speak("host-max", f"{TRANSITION_INTRO} {market_line}")
+            return
+        
+        intro = await agent.synthesize(TRANSITION_INTRO, cache=True)
+        market_frames = asyncio.create_task(agent.synthesize(market_line))
+        try:
+            print(f"   🎤 {agent.name} speaking: {TRANSITION_INTRO} {market.short_question}")
+            with self._speaking():
+                await agent.play(intro)
+                await agent.play(await market_frames)
+        finally:
+            market_frames.cancel()
+    
+    async def _wait_for_votes(self):
+        """Wait out the voting window, ending early once the vote is decisive"""
+        try:
+            await asyncio.wait_for(
+                self.voting_server.early_close_event.wait(),
+                timeout=self.voting_duration
+            )
+            print("   ⏩ Vote is decisive, closing early")
+        except asyncio.TimeoutError:
+            pass
+    
     async def run_voting_phase(self) -> Market:
         """Run voting phase and return winning market"""
         # Get 2 candidate markets
-        candidates = self.polymarket.get_candidate_markets(
-            exclude_ids=self.discussed_market_ids
-        )
+        candidates = await self._pick_candidates(self.discussed_market_ids)
         
         if len(candidates) < 2:
             print("⚠️ Not enough candidate markets, refetching...")
             self.discussed_market_ids.clear()
-            candidates = self.polymarket.get_candidate_markets()
+            candidates = await self._pick_candidates()
         
         # Announce voting
-        candidate_names = [c.question[:50] for c in candidates]
-        await self.voting_server.open_voting(candidate_names)
+        candidate_names = [c.short_question for c in candidates]
+        await self.voting_server.open_voting(candidate_names, duration=self.voting_duration)
         
         # Have hosts announce the options
-        await self.send_to_agent(
+        # speak() returns once playout drains, so the hosts follow each other directly
+        await self.speak(
             "host-max",
             f"Alright traders! Time to VOTE! Option 1: {candidates[0].question}"
         )
-        await asyncio.sleep(5)
-        await self.send_to_agent(
+        await self.speak(
             "host-ben", 
             f"And Option 2: {candidates[1].question}. You have 60 seconds. Choose wisely."
         )
         
         # Wait for voting
-        await asyncio.sleep(self.voting_duration)
+        await self._wait_for_votes()
         
         # Close voting and get results
         results = await self.voting_server.close_voting()
@@ -312,35 +450,28 @@ class ShowOrchestrator:
         """Main show loop"""
         print("🚀 Starting Polymarket AI Show!")
         
+        if self._watchdog_enabled:
+            self._watchdog_task = asyncio.create_task(watch_loop_lag())
+        
         # Setup
         await self.stream_controller.create_room()
         # No need to dispatch agents - they're in-process classes now
         
-        # Connect orchestrator as participant and create centralized audio track
-        # This ensures egress sees a track immediately (solving chicken-and-egg problem)
-        await self._connect_as_participant()
-        await asyncio.sleep(1)  # Brief wait for track to be published
-        
-        # Trigger agents to speak so they publish audio tracks
-        print("🎤 Triggering agents to speak (so they publish tracks)...")
-        try:
-            await self.speak("host-max", "Welcome to the Polymarket AI Show! Let's get started.")
-            await self.speak("host-ben", "Ready to discuss some markets.")
-        except Exception as e:
-            print(f"⚠️ Could not trigger agents to speak: {e}")
-            import traceback
-            traceback.print_exc()
-        
-        # No RTMP egress needed - viewers connect directly via website
-        # await self.stream_controller.start_twitch_stream()  # Removed
-        
-        # Start web voting server (website connects to this)
-        await self.voting_server.start()
-        await asyncio.sleep(1)  # Wait for server to start
+        # Independent startup steps run concurrently:
+        # - connect orchestrator as participant and publish the centralized and host
+        #   audio tracks (egress sees a track immediately, solving the chicken-and-egg problem)
+        # - start web voting server (website connects to this)
+        # - fetch the initial market pool
+        # No RTMP egress needed - viewers connect directly via website (if re-enabled,
+        # pass track_ready=self._track_ready to start_twitch_stream)
+        _, _, pool = await asyncio.gather(
+            self._connect_as_participant(),
+            self.voting_server.start(),
+            self._get_pool(),
+        )
         
         # Get initial market
-        initial_markets = self.polymarket.get_trending_markets(limit=1)
-        self.current_market = initial_markets[0]
+        self.current_market = pool[0]
         
         try:
             while True:
@@ -351,8 +482,8 @@ class ShowOrchestrator:
                 # Mark old market as discussed BEFORE starting discussion
                 # This ensures it won't be selected in voting
                 if old_market and old_market.id not in self.discussed_market_ids:
-                    self.discussed_market_ids.append(old_market.id)
-                    print(f"   📝 Marked market as discussed: {old_market.question[:50]}...")
+                    self._mark_discussed(old_market.id)
+                    print(f"   📝 Marked market as discussed: {old_market.short_question}")
                 
                 # Run discussion (voting happens during last minute)
                 next_market = await self.run_discussion(self.current_market)
@@ -361,12 +492,11 @@ class ShowOrchestrator:
                 if next_market.id == old_market.id:
                     print(f"⚠️ WARNING: Voting returned same market! Fetching new market directly...")
                     # Fallback: just get a new trending market
-                    exclude_ids = self.discussed_market_ids.copy()
-                    if old_market.id not in exclude_ids:
-                        exclude_ids.append(old_market.id)
-                    new_markets = self.polymarket.get_trending_markets(limit=10)
-                    exclude_set = set(exclude_ids)
-                    available = [m for m in new_markets if m.id not in exclude_set]
+                    new_markets = await self._get_pool()
+                    available = [
+                        m for m in new_markets
+                        if m.id not in self.discussed_market_ids and m.id != old_market.id
+                    ]
                     if available:
                         next_market = available[0]
                     else:
@@ -377,14 +507,15 @@ class ShowOrchestrator:
                 self.current_market = next_market
                 
                 # Brief transition to new market
-                await self.speak(
-                    "host-max",
-                    f"The people have spoken! Let's dive into: {self.current_market.question}!"
-                )
+                await self._announce_market(self.current_market)
                 
         except KeyboardInterrupt:
             print("\n👋 Shutting down...")
         finally:
+            await self._stop_silence_feed()
+            if self._watchdog_task:
+                self._watchdog_task.cancel()
+            
             # Disconnect orchestrator participant
             if self.room:
                 try:
@@ -393,10 +524,13 @@ class ShowOrchestrator:
                     pass
             await self.stream_controller.cleanup()
             await self.voting_server.stop()
+            await self.polymarket.close()
 
 async def main():
     orchestrator = ShowOrchestrator()
     await orchestrator.run_show_loop()
 
 if __name__ == "__main__":
+    setup_logging()
+    install_uvloop()
     asyncio.run(main())
\ No newline at end of file
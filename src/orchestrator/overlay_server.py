@@ -1,21 +1,123 @@
 """Simple HTTP server to serve overlay files for LiveKit egress"""
 import os
 import asyncio
+import gzip
+import hashlib
+import mimetypes
+import socket
 from pathlib import Path
+from typing import Dict, NamedTuple
 from aiohttp import web
 from aiohttp.web import Response
 
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
 # Get overlay directory path (relative to project root)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 OVERLAY_DIR = PROJECT_ROOT / "overlays"
 
+# MIME types for overlay assets
+MIME_TYPES = {
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.svg': 'image/svg+xml',
+}
+
+# Register our MIME types so mimetypes (and FileResponse) agree with them; other
+# extensions fall back to the platform's table
+for _ext, _mime in MIME_TYPES.items():
+    mimetypes.add_type(_mime, _ext)
+
+OVERLAY_CACHE_CONTROL = "public, max-age=3600"
+
+# Set OVERLAY_PRELOAD=0 to serve overlays from disk, picking up edits without a restart
+OVERLAY_PRELOAD = os.getenv("OVERLAY_PRELOAD", "1") != "0"
+
+# Compressed variants, in order of preference when the client accepts several
+COMPRESSORS = {"gzip": lambda body: gzip.compress(body, compresslevel=9)}
+if brotli is not None:
+    COMPRESSORS = {"br": lambda body: brotli.compress(body, quality=11), **COMPRESSORS}
+
+class OverlayFile(NamedTuple):
+    """An overlay asset held in memory"""
+    body: bytes
+    content_type: str
+    etag: str
+    encoded: Dict[str, bytes]  # Content-Encoding -> pre-compressed body (only if smaller)
+
+def _encode_variants(body: bytes) -> Dict[str, bytes]:
+    """Pre-compress body once with every available encoder, keeping only the wins"""
+    variants = {}
+    for encoding, compress in COMPRESSORS.items():
+        compressed = compress(body)
+        if len(compressed) < len(body):
+            variants[encoding] = compressed
+    return variants
+
+# Overlay files preloaded at app creation, keyed by path relative to OVERLAY_DIR
+OVERLAY_FILES = web.AppKey("overlay_files", Dict[str, OverlayFile])
+
+def load_overlay_files(directory: Path = OVERLAY_DIR) -> Dict[str, OverlayFile]:
+    """Read every file under the overlay directory into memory"""
+    files = {}
+    pending = [directory] if directory.is_dir() else []
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    path = Path(entry.path)
+                    body = path.read_bytes()
+                    files[path.relative_to(directory).as_posix()] = OverlayFile(
+                        body=body,
+                        content_type=mimetypes.guess_type(path.name)[0] or 'application/octet-stream',
+                        etag=f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"',
+                        encoded=_encode_variants(body),
+                    )
+    return files
+
 async def serve_overlay_file(request):
-    """Serve overlay files with proper MIME types"""
-    filename = request.match_info.get('filename', 'index.html')
-    
+    """Serve overlay files from memory with proper MIME types"""
     # Handle root route - serve index.html
-    if not filename or filename == '':
-        filename = 'index.html'
+    filename = request.match_info.get('filename') or 'index.html'
+    
+    # Security: only preloaded files from the overlay directory can be served,
+    # so path traversal has nothing to match
+    overlay_file = request.app[OVERLAY_FILES].get(filename)
+    if overlay_file is None:
+        return Response(text=f"File not found: {filename}", status=404)
+    
+    # Pick the preferred pre-compressed variant the client accepts
+    accepted = {token.split(";")[0].strip() for token in request.headers.get("Accept-Encoding", "").split(",")}
+    encoding = next((e for e in overlay_file.encoded if e in accepted), None)
+    
+    body = overlay_file.body
+    # Each representation gets its own ETag
+    etag = overlay_file.etag
+    headers = {"Cache-Control": OVERLAY_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if encoding:
+        body = overlay_file.encoded[encoding]
+        etag = f'{etag[:-1]}-{encoding}"'
+        headers["Content-Encoding"] = encoding
+    headers["ETag"] = etag
+    
+    if request.headers.get("If-None-Match") == etag:
+        headers.pop("Content-Encoding", None)
+        return Response(status=304, headers=headers)
+    
+    return Response(body=body, content_type=overlay_file.content_type, headers=headers)
+
+async def serve_overlay_file_from_disk(request):
+    """Serve overlay files straight from disk (sendfile, no event-loop blocking reads)"""
+    filename = request.match_info.get('filename') or 'index.html'
     
     # Security: only allow files from overlay directory
     file_path = OVERLAY_DIR / filename
@@ -26,41 +128,27 @@ async def serve_overlay_file(request):
     except ValueError:
         return Response(text="Invalid file path", status=403)
     
-    if not file_path.exists() or not file_path.is_file():
+    if not file_path.is_file():
         return Response(text=f"File not found: {filename}", status=404)
     
-    # Determine MIME type
-    mime_types = {
-        '.html': 'text/html',
-        '.css': 'text/css',
-        '.js': 'application/javascript',
-        '.png': 'image/png',
-        '.jpg': 'image/jpeg',
-        '.jpeg': 'image/jpeg',
-        '.svg': 'image/svg+xml',
-    }
-    
-    ext = file_path.suffix.lower()
-    content_type = mime_types.get(ext, 'application/octet-stream')
-    
-    # Read and serve file
-    try:
-        with open(file_path, 'rb') as f:
-            content = f.read()
-        return Response(body=content, content_type=content_type)
-    except Exception as e:
-        return Response(text=f"Error reading file: {e}", status=500)
+    # FileResponse streams via sendfile and handles ETag/Last-Modified itself
+    return web.FileResponse(file_path)
 
 def create_overlay_app():
     """Create aiohttp application for serving overlays"""
     app = web.Application()
+    if OVERLAY_PRELOAD:
+        app[OVERLAY_FILES] = load_overlay_files()
+        handler = serve_overlay_file
+    else:
+        handler = serve_overlay_file_from_disk
     
     # Route for index.html (default)
-    app.router.add_get('/', lambda r: serve_overlay_file(r))
-    app.router.add_get('/index.html', lambda r: serve_overlay_file(r))
+    app.router.add_get('/', handler)
+    app.router.add_get('/index.html', handler)
     
     # Route for other files
-    app.router.add_get('/{filename}', serve_overlay_file)
+    app.router.add_get('/{filename}', handler)
     
     return app
 
@@ -74,7 +162,13 @@ async def start_overlay_server(host='127.0.0.1', port=8080):
     runner = web.AppRunner(app)
     await runner.setup()
     
-    site = web.TCPSite(runner, host, port)
+    # aiohttp already sets TCP_NODELAY on accepted connections; SO_REUSEPORT is
+    # unavailable on Windows
+    site = web.TCPSite(
+        runner, host, port,
+        backlog=128,
+        reuse_port=hasattr(socket, "SO_REUSEPORT"),
+    )
     await site.start()
     
     url = f"http://{host}:{port}"
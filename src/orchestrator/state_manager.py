@@ -1,7 +1,7 @@
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 from enum import Enum, auto
-from typing import Optional, List
+from typing import Optional, Set
 from ..polymarket.models import Market
 from ..utils.logging import get_logger
 
@@ -23,15 +23,15 @@ class ShowState:
     """Represents the current state of the show"""
     phase: ShowPhase = ShowPhase.STARTING
     current_market: Optional[Market] = None
-    phase_start_time: datetime = field(default_factory=datetime.now)
+    phase_start_monotonic: float = field(default_factory=time.monotonic)
     discussion_number: int = 0
     total_votes_cast: int = 0
-    discussed_market_ids: List[str] = field(default_factory=list)
+    discussed_market_ids: Set[str] = field(default_factory=set)
     
     @property
     def phase_elapsed_seconds(self) -> float:
         """Seconds elapsed in current phase"""
-        return (datetime.now() - self.phase_start_time).total_seconds()
+        return time.monotonic() - self.phase_start_monotonic
     
     @property
     def is_active(self) -> bool:
@@ -59,46 +59,51 @@ class StateManager:
         self._listeners.append(callback)
     
     async def _notify_listeners(self) -> None:
-        """Notify all listeners of state change"""
+        """Notify all listeners of state change (async listeners run concurrently)"""
+        coros = []
         for listener in self._listeners:
+            if asyncio.iscoroutinefunction(listener):
+                coros.append(listener(self.state))
+                continue
             try:
-                if asyncio.iscoroutinefunction(listener):
-                    await listener(self.state)
-                else:
-                    listener(self.state)
+                listener(self.state)
             except Exception as e:
                 logger.error(f"Error notifying listener: {e}")
+        
+        # One failing listener doesn't stop the others
+        for result in await asyncio.gather(*coros, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error notifying listener: {result}")
     
     def start_show(self, initial_market: Market) -> None:
         """Start the show with an initial market"""
         self.state.phase = ShowPhase.DISCUSSION
         self.state.current_market = initial_market
-        self.state.phase_start_time = datetime.now()
+        self.state.phase_start_monotonic = time.monotonic()
         self.state.discussion_number = 1
-        logger.info(f"Show started with market: {initial_market.question[:50]}...")
+        logger.info(f"Show started with market: {initial_market.short_question}")
     
     def start_discussion(self, market: Market) -> None:
         """Start discussing a new market"""
         self.state.phase = ShowPhase.DISCUSSION
         self.state.current_market = market
-        self.state.phase_start_time = datetime.now()
+        self.state.phase_start_monotonic = time.monotonic()
         self.state.discussion_number += 1
         
-        if market.id not in self.state.discussed_market_ids:
-            self.state.discussed_market_ids.append(market.id)
+        self.state.discussed_market_ids.add(market.id)
         
-        logger.info(f"Started discussion #{self.state.discussion_number}: {market.question[:50]}...")
+        logger.info(f"Started discussion #{self.state.discussion_number}: {market.short_question}")
     
     def start_voting(self) -> None:
         """Transition to voting phase"""
         self.state.phase = ShowPhase.VOTING
-        self.state.phase_start_time = datetime.now()
+        self.state.phase_start_monotonic = time.monotonic()
         logger.info("Voting phase started")
     
     def start_transition(self) -> None:
         """Start brief transition between markets"""
         self.state.phase = ShowPhase.TRANSITION
-        self.state.phase_start_time = datetime.now()
+        self.state.phase_start_monotonic = time.monotonic()
         logger.info("Transition phase started")
     
     def end_show(self) -> None:
@@ -117,7 +122,7 @@ class StateManager:
             self.state.phase = ShowPhase.DISCUSSION
         else:
             self.state.phase = ShowPhase.STARTING
-        self.state.phase_start_time = datetime.now()
+        self.state.phase_start_monotonic = time.monotonic()
         logger.info("Show resumed")
     
     def record_votes(self, count: int) -> None:
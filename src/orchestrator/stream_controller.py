@@ -1,5 +1,8 @@
 import os
 import asyncio
+import random
+import time
+from typing import Optional
 from livekit import api
 from livekit.protocol.egress import (
     RoomCompositeEgressRequest,
@@ -7,8 +10,27 @@ from livekit.protocol.egress import (
     StreamProtocol,
     EncodingOptionsPreset,
 )
+from livekit.protocol.models import ParticipantInfo, TrackSource
 from livekit.api.agent_dispatch_service import CreateAgentDispatchRequest
 from .overlay_server import start_overlay_server, stop_overlay_server
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Resolved once from the protocol types instead of probing every participant
+_TRACKS_ATTR = "tracks" if "tracks" in ParticipantInfo.DESCRIPTOR.fields_by_name else "published_tracks"
+_SOURCE_NAMES = {value: name for name, value in TrackSource.items()}
+
+# Time budgets for the startup polling loops (seconds)
+PARTICIPANT_WAIT_TIMEOUT = 30
+EGRESS_STATUS_TIMEOUT = 15
+BACKOFF_CAP = 10.0  # Longest single backoff sleep (seconds)
+
+
+async def _backoff_sleep(attempt: int, base: float = 0.5, cap: float = BACKOFF_CAP):
+    """Sleep with exponential backoff and full jitter: uniform(0, min(cap, base * 2**attempt))"""
+    await asyncio.sleep(random.uniform(0, min(cap, base * 2 ** attempt)))
+
 
 class StreamController:
     def __init__(self):
@@ -16,7 +38,13 @@ class StreamController:
         self.room_name = os.getenv("ROOM_NAME", "polymarket-ai-show")
         self.egress_id = None
         self.overlay_server_runner = None
-        self.overlay_url = None
+        self.overlay_url = None  # Overlay actually in use by the running egress
+        
+        # Egress settings, read once (Twitch egress is optional, so a missing key
+        # is only an error when start_twitch_stream is called)
+        self.stream_key = os.getenv("TWITCH_STREAM_KEY")
+        self.configured_overlay_url = os.getenv("OVERLAY_URL")
+        self.use_overlay = os.getenv("USE_OVERLAY", "false").lower() == "true"
         
     async def create_room(self):
         """Create the LiveKit room for the show"""
@@ -27,7 +55,7 @@ class StreamController:
                 max_participants=10,
             )
         )
-        print(f"✅ Room created: {room_info.name}")
+        logger.info(f"✅ Room created: {room_info.name}")
         return room_info
     
     async def dispatch_agents(self):
@@ -44,7 +72,7 @@ class StreamController:
                 agent_name="host-ben"
             )
         )
-        print("✅ AI hosts dispatched to room")
+        logger.info("✅ AI hosts dispatched to room")
     
     async def check_room_participants(self) -> tuple[bool, int]:
         """Check if room has participants with tracks
@@ -58,99 +86,99 @@ class StreamController:
                 room_detail = await self.lkapi.room.list_participants(
                     api.ListParticipantsRequest(room=self.room_name)
                 )
-                participant_count = len(room_detail.participants)
-                print(f"📊 Room has {participant_count} participant(s)")
+                participants = room_detail.participants
+                participant_count = len(participants)
+                logger.info(f"📊 Room has {participant_count} participant(s)")
                 
                 # Check if participants have tracks
                 has_tracks = False
                 track_details = []
-                for participant in room_detail.participants:
-                    tracks = []
-                    if hasattr(participant, 'tracks'):
-                        tracks = participant.tracks if participant.tracks else []
-                    elif hasattr(participant, 'published_tracks'):
-                        tracks = participant.published_tracks if participant.published_tracks else []
+                for participant in participants:
+                    tracks = getattr(participant, _TRACKS_ATTR, None) or ()
                     
                     if tracks:
                         has_tracks = True
-                        # Convert track source to string (it's an enum/int)
-                        track_types = []
-                        for t in tracks:
-                            source = getattr(t, 'source', None)
-                            if source is not None:
-                                # Convert enum/int to string
-                                track_types.append(str(source) if not isinstance(source, str) else source)
-                            else:
-                                track_types.append('unknown')
+                        # Track source is an enum int; look up its name
+                        track_types = [_SOURCE_NAMES.get(t.source, 'unknown') for t in tracks]
                         track_details.append(f"   ✅ {participant.identity}: {len(tracks)} track(s) - {', '.join(track_types)}")
                     else:
                         track_details.append(f"   ⚠️ {participant.identity}: No tracks published yet")
                 
                 for detail in track_details:
-                    print(detail)
+                    logger.info(detail)
                 
                 return has_tracks, participant_count
             except Exception as e:
-                print(f"⚠️ Could not list participants: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"⚠️ Could not list participants: {e}")
                 return False, 0
         except Exception as e:
-            print(f"⚠️ Error checking room participants: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"⚠️ Error checking room participants: {e}")
             return False, 0
     
-    async def start_twitch_stream(self):
-        """Start RTMP egress to Twitch"""
-        # Check if room has participants before starting egress
-        print("🔍 Checking room for participants...")
+    async def start_twitch_stream(self, track_ready: Optional[asyncio.Event] = None):
+        """Start RTMP egress to Twitch
+        
+        track_ready, if given, is set once an audio track is published; egress then
+        starts as soon as it fires instead of polling the room.
+        """
+        # Validate settings before waiting on the room, not after
+        if not self.stream_key:
+            raise ValueError("TWITCH_STREAM_KEY environment variable not set")
+        
+        if track_ready is not None:
+            try:
+                await asyncio.wait_for(track_ready.wait(), timeout=PARTICIPANT_WAIT_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("⚠️ No audio track signalled in time; polling the room instead")
+        
+        # Check if room has participants before starting egress (after track_ready,
+        # this normally confirms the track on the first call)
+        logger.info("🔍 Checking room for participants...")
         has_tracks, participant_count = await self.check_room_participants()
+        deadline = time.monotonic() + PARTICIPANT_WAIT_TIMEOUT
         
-        # If no participants or no tracks, wait and retry
-        max_retries = 6
-        retry_count = 0
-        while (participant_count == 0 or not has_tracks) and retry_count < max_retries:
+        # If no participants or no tracks, back off and retry until the deadline
+        attempt = 0
+        while participant_count == 0 or not has_tracks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             if participant_count == 0:
-                print(f"⚠️ No participants in room yet. Waiting 5 seconds... (attempt {retry_count + 1}/{max_retries})")
+                logger.warning(f"⚠️ No participants in room yet. Retrying... (attempt {attempt + 1}, {remaining:.0f}s left)")
             else:
-                print(f"⚠️ Participants exist but no tracks published yet. Waiting 5 seconds... (attempt {retry_count + 1}/{max_retries})")
-                print("   Note: Agents only publish tracks when they speak. They may need to receive a message first.")
+                logger.warning(f"⚠️ Participants exist but no tracks published yet. Retrying... (attempt {attempt + 1}, {remaining:.0f}s left)")
+                logger.warning("   Note: Agents only publish tracks when they speak. They may need to receive a message first.")
             
-            await asyncio.sleep(5)
+            await _backoff_sleep(attempt, cap=min(BACKOFF_CAP, remaining))
             has_tracks, participant_count = await self.check_room_participants()
-            retry_count += 1
+            attempt += 1
         
         if not has_tracks:
-            print("❌ WARNING: Starting egress without tracks. Egress will likely stay in STARTING state.")
-            print("   Agents need to speak to publish audio tracks. Make sure agents are running and will receive messages.")
-        
-        stream_key = os.getenv("TWITCH_STREAM_KEY")
-        if not stream_key:
-            raise ValueError("TWITCH_STREAM_KEY environment variable not set")
+            logger.error("❌ WARNING: Starting egress without tracks. Egress will likely stay in STARTING state.")
+            logger.error("   Agents need to speak to publish audio tracks. Make sure agents are running and will receive messages.")
         
         stream_output = StreamOutput(
             protocol=StreamProtocol.RTMP,
-            urls=[f"rtmp://live.twitch.tv/app/{stream_key}"]
+            urls=[f"rtmp://live.twitch.tv/app/{self.stream_key}"]
         )
         
         # Setup overlay URL for visual template
         # NOTE: custom_base_url requires the HTML to include LiveKit recorder code
         # If your overlay doesn't have LiveKit connection code, it will cause egress to fail
         # For now, we'll make overlay optional to ensure stream works
-        overlay_url = os.getenv("OVERLAY_URL", None)
-        use_overlay = os.getenv("USE_OVERLAY", "false").lower() == "true"
+        overlay_url = self.configured_overlay_url
+        use_overlay = self.use_overlay
         
         # Only use overlay if explicitly enabled AND URL is provided
         if overlay_url and use_overlay:
-            print(f"📺 Overlay enabled: {overlay_url}")
-            print("⚠️  WARNING: Using custom_base_url requires LiveKit recorder code in your overlay HTML.")
-            print("   If your overlay doesn't connect to LiveKit, egress will fail.")
-            print("   Set USE_OVERLAY=false to disable and use default layout.")
+            logger.info(f"📺 Overlay enabled: {overlay_url}")
+            logger.warning("⚠️  WARNING: Using custom_base_url requires LiveKit recorder code in your overlay HTML.")
+            logger.warning("   If your overlay doesn't connect to LiveKit, egress will fail.")
+            logger.warning("   Set USE_OVERLAY=false to disable and use default layout.")
             self.overlay_url = overlay_url
         else:
             if overlay_url:
-                print(f"📺 Overlay URL found but disabled (set USE_OVERLAY=true to enable): {overlay_url}")
+                logger.info(f"📺 Overlay URL found but disabled (set USE_OVERLAY=true to enable): {overlay_url}")
             overlay_url = None  # Don't use overlay
             self.overlay_url = None
         
@@ -165,77 +193,91 @@ class StreamController:
         # Add overlay URL if enabled (must have LiveKit recorder code)
         if overlay_url and use_overlay:
             request_kwargs["custom_base_url"] = overlay_url
-            print(f"✅ Using custom overlay: {overlay_url}")
+            logger.info(f"✅ Using custom overlay: {overlay_url}")
         else:
-            print("✅ Using default LiveKit layout (no custom overlay)")
+            logger.info("✅ Using default LiveKit layout (no custom overlay)")
         
         request = RoomCompositeEgressRequest(**request_kwargs)
         
         try:
             info = await self.lkapi.egress.start_room_composite_egress(request)
             self.egress_id = info.egress_id
-            print(f"✅ Egress request accepted! Egress ID: {self.egress_id}")
-            print(f"   Status: {getattr(info, 'status', 'UNKNOWN')}")
+            logger.info(f"✅ Egress request accepted! Egress ID: {self.egress_id}")
+            logger.info(f"   Status: {getattr(info, 'status', 'UNKNOWN')}")
             
             # Wait and periodically check egress status
-            print("   Monitoring egress status...")
-            for i in range(5):
-                await asyncio.sleep(3)
+            logger.info("   Monitoring egress status...")
+            deadline = time.monotonic() + EGRESS_STATUS_TIMEOUT
+            attempt = 0
+            while (remaining := deadline - time.monotonic()) > 0:
+                await _backoff_sleep(attempt, cap=min(BACKOFF_CAP, remaining))
+                attempt += 1
                 try:
                     egress_info = await self.lkapi.egress.list_egress(
                         api.ListEgressRequest(room_name=self.room_name)
                     )
-                    if egress_info.items:
-                        for item in egress_info.items:
+                    egress_items = egress_info.items
+                    if egress_items:
+                        for item in egress_items:
                             if item.egress_id == self.egress_id:
                                 status = getattr(item, 'status', 'UNKNOWN')
-                                print(f"   Status check {i+1}/5: {status}")
+                                logger.info(f"   Status check {attempt}: {status}")
                                 if status in ['EGRESS_ACTIVE', 'ACTIVE', 'RUNNING']:
-                                    print("   ✅ Egress is ACTIVE! Stream should be live on Twitch.")
+                                    logger.info("   ✅ Egress is ACTIVE! Stream should be live on Twitch.")
                                     return info
                                 elif status in ['EGRESS_COMPLETE', 'COMPLETE', 'FINISHED']:
-                                    print("   ⚠️ Egress completed (may have ended)")
+                                    logger.warning("   ⚠️ Egress completed (may have ended)")
                                     return info
                                 elif status in ['EGRESS_FAILED', 'FAILED', 'ERROR']:
                                     error_msg = getattr(item, 'error', 'Unknown error')
-                                    print(f"   ❌ Egress FAILED: {error_msg}")
+                                    logger.error(f"   ❌ Egress FAILED: {error_msg}")
                                     return info
                                 elif hasattr(item, 'error') and item.error:
-                                    print(f"   ⚠️ Error detected: {item.error}")
+                                    logger.warning(f"   ⚠️ Error detected: {item.error}")
                 except Exception as e:
-                    print(f"   ⚠️ Could not check egress status: {e}")
+                    logger.warning(f"   ⚠️ Could not check egress status: {e}")
             
-            print("   ⚠️ Egress still in STARTING state. This may indicate:")
-            print("      - No participants with tracks in the room")
-            print("      - RTMP connection to Twitch is failing")
-            print("      - Egress service is having issues")
-            print("   Check the LiveKit console for more details.")
+            logger.warning("   ⚠️ Egress still in STARTING state. This may indicate:")
+            logger.warning("      - No participants with tracks in the room")
+            logger.warning("      - RTMP connection to Twitch is failing")
+            logger.warning("      - Egress service is having issues")
+            logger.warning("   Check the LiveKit console for more details.")
             
             return info
         except Exception as e:
-            print(f"❌ Failed to start egress: {e}")
-            print(f"   Error type: {type(e).__name__}")
+            logger.error(f"❌ Failed to start egress: {e}")
+            logger.error(f"   Error type: {type(e).__name__}")
             raise
     
     async def stop_stream(self):
-        """Stop the Twitch stream"""
-        if self.egress_id:
+        """Stop the Twitch stream (safe to call more than once)"""
+        egress_id, self.egress_id = self.egress_id, None
+        if egress_id:
             await self.lkapi.egress.stop_egress(
-                api.StopEgressRequest(egress_id=self.egress_id)
+                api.StopEgressRequest(egress_id=egress_id)
             )
-            print("⏹️ Stream stopped")
+            logger.info("⏹️ Stream stopped")
+    
+    async def _stop_overlay(self):
+        """Stop overlay server if running"""
+        runner, self.overlay_server_runner = self.overlay_server_runner, None
+        if runner:
+            logger.info("🛑 Stopping overlay server...")
+            await stop_overlay_server(runner)
     
     async def cleanup(self):
         """Clean up resources"""
-        await self.stop_stream()
-        
-        # Stop overlay server if running
-        if self.overlay_server_runner:
-            print("🛑 Stopping overlay server...")
-            await stop_overlay_server(self.overlay_server_runner)
-            self.overlay_server_runner = None
-        
-        await self.lkapi.room.delete_room(
-            api.DeleteRoomRequest(room=self.room_name)
+        # Independent teardown steps run concurrently; one failing doesn't skip the others
+        results = await asyncio.gather(
+            self.stop_stream(),
+            self._stop_overlay(),
+            self.lkapi.room.delete_room(
+                api.DeleteRoomRequest(room=self.room_name)
+            ),
+            return_exceptions=True,
         )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ Cleanup step failed: {result}")
+        
         await self.lkapi.aclose()
\ No newline at end of file
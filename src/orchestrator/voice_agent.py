@@ -1,17 +1,38 @@
 import asyncio
 import os
 import io
-import numpy as np
+import threading
+from collections import OrderedDict
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Union
+import httpx
 from elevenlabs.client import ElevenLabs
 from elevenlabs import stream
 from livekit.rtc import AudioSource, LocalAudioTrack, TrackPublishOptions, TrackSource, AudioFrame
+from ..utils.http import HTTP_LIMITS
 
 # Initialize ElevenLabs client
 # Note: Environment variable is ELEVEN_API_KEY (not ELEVENLABS_API_KEY)
 elevenlabs_api_key = os.getenv("ELEVEN_API_KEY")
 if not elevenlabs_api_key:
     raise ValueError("ELEVEN_API_KEY environment variable not set")
-elevenlabs_client = ElevenLabs(api_key=elevenlabs_api_key)
+# Both hosts share one pooled client; HTTP_LIMITS keeps idle connections for
+# minutes (httpx defaults to 5s), so each utterance reuses a warm TLS connection
+# instead of reconnecting after the previous ~60s line
+elevenlabs_client = ElevenLabs(
+    api_key=elevenlabs_api_key,
+    httpx_client=httpx.Client(limits=HTTP_LIMITS, follow_redirects=True),
+)
+
+
+async def _iterate(frames: Union[Iterable[AudioFrame], AsyncIterable[AudioFrame]]) -> AsyncIterator[AudioFrame]:
+    """Iterate sync or async frame sources uniformly"""
+    if hasattr(frames, "__aiter__"):
+        async for frame in frames:
+            yield frame
+    else:
+        for frame in frames:
+            yield frame
+
 
 class VoiceAgent:
     """In-process voice agent that generates and plays audio directly"""
@@ -24,112 +45,178 @@ class VoiceAgent:
         self.audio_source: AudioSource = None
         self.audio_track: LocalAudioTrack = None
         self.current_publication = None
+        self._synth_cache: "OrderedDict[str, List[AudioFrame]]" = OrderedDict()  # Recurring lines
         
         # Audio settings
         self.SAMPLE_RATE = 24000  # ElevenLabs default
         self.NUM_CHANNELS = 1
         self.FRAME_DURATION_MS = 20  # 20ms frames
         self.SAMPLES_PER_FRAME = int(self.SAMPLE_RATE * self.FRAME_DURATION_MS / 1000)
+        self.SOURCE_QUEUE_MS = 200  # LiveKit-side buffer; absorbs bursty TTS chunk arrival
+        self.CHUNK_QUEUE_SIZE = 10  # TTS chunks (each a batch of frames) buffered ahead of playback
+        self.SYNTH_CACHE_SIZE = 64  # Max cached lines (only short, recurring lines are cached)
     
-    async def _ensure_track_published(self):
-        """Ensure audio track is published to room"""
-        if self.audio_track is None or self.current_publication is None:
-            # Create audio source and track
-            self.audio_source = AudioSource(self.SAMPLE_RATE, self.NUM_CHANNELS)
-            self.audio_track = LocalAudioTrack.create_audio_track(
-                f"{self.name}-audio", 
-                self.audio_source
-            )
-            
-            # Publish track
-            options = TrackPublishOptions(source=TrackSource.SOURCE_MICROPHONE)
-            self.current_publication = await self.participant.publish_track(
-                self.audio_track, 
-                options
-            )
-            print(f"   ✅ {self.name} audio track published")
-    
-    async def speak(self, text: str) -> None:
-        """Generate TTS audio and play it to the room. Blocks until playback completes."""
-        print(f"   🎤 {self.name} speaking: {text[:50]}...")
+    async def prepare(self):
+        """Create and publish the audio track; call once, ahead of the first utterance"""
+        if self.current_publication is not None:
+            raise RuntimeError(f"{self.name} audio track is already published")
         
-        # Ensure track is published
-        await self._ensure_track_published()
+        # Create audio source and track
+        self.audio_source = AudioSource(
+            self.SAMPLE_RATE, self.NUM_CHANNELS, queue_size_ms=self.SOURCE_QUEUE_MS
+        )
+        self.audio_track = LocalAudioTrack.create_audio_track(
+            f"{self.name}-audio", 
+            self.audio_source
+        )
         
-        try:
-            # Generate audio from ElevenLabs (streaming, PCM format)
-            audio_generator = elevenlabs_client.text_to_speech.stream(
-                voice_id=self.voice_id,
-                text=text,
-                model_id="eleven_v3",
-                output_format="pcm_24000",  # Raw PCM, 24kHz, 16-bit, mono
-            )
-            
-            # Buffer to accumulate audio chunks
-            audio_buffer = bytearray()
-            bytes_per_frame = self.SAMPLES_PER_FRAME * 2  # 2 bytes per sample (16-bit)
-            frame_interval = self.FRAME_DURATION_MS / 1000  # 20ms in seconds
+        # Publish track
+        options = TrackPublishOptions(source=TrackSource.SOURCE_MICROPHONE)
+        self.current_publication = await self.participant.publish_track(
+            self.audio_track, 
+            options
+        )
+        print(f"   ✅ {self.name} audio track published")
+    
+    async def publish_track(self) -> None:
+        """Publish the audio track and push one silent frame, without speaking"""
+        await self.prepare()
+        await self.audio_source.capture_frame(
+            AudioFrame.create(self.SAMPLE_RATE, self.NUM_CHANNELS, self.SAMPLES_PER_FRAME)
+        )
+    
+    def _pcm_stream(self, text: str):
+        """Start an ElevenLabs TTS stream (raw PCM, 24kHz, 16-bit, mono)"""
+        return elevenlabs_client.text_to_speech.stream(
+            voice_id=self.voice_id,
+            text=text,
+            model_id="eleven_v3",
+            output_format="pcm_24000",  # Raw PCM, 24kHz, 16-bit, mono
+        )
+    
+    def _frames(self, audio_chunks: Iterable[bytes]) -> Iterator[AudioFrame]:
+        """Slice raw PCM chunks into fixed-size AudioFrames, zero-padding the last one"""
+        for batch in self._frame_batches(audio_chunks):
+            yield from batch
+    
+    def _frame_batches(self, audio_chunks: Iterable[bytes]) -> Iterator[List[AudioFrame]]:
+        """Like _frames, but yields the frames completed by each chunk as one list"""
+        bytes_per_frame = self.SAMPLES_PER_FRAME * 2  # 2 bytes per sample (16-bit)
+        # Only a frame straddling two chunks is assembled here; it never holds more
+        # than one frame, and whole frames are copied straight out of the chunk
+        pending = bytearray()
+        
+        for audio_chunk in audio_chunks:
+            if not audio_chunk:
+                continue
             
-            # Use a timer-based approach for smooth frame delivery
-            last_frame_time = None
+            batch = []
+            offset = 0
+            if pending:
+                # Complete the straddling frame first
+                offset = min(bytes_per_frame - len(pending), len(audio_chunk))
+                with memoryview(audio_chunk) as chunk_view:
+                    pending += chunk_view[:offset]
+                if len(pending) == bytes_per_frame:
+                    batch.append(self._make_frame(pending))
+                    pending.clear()
             
-            # Stream audio chunks to LiveKit
-            for audio_chunk in audio_generator:
-                if not audio_chunk:
-                    continue
-                
-                audio_buffer.extend(audio_chunk)
-                
-                # Process complete frames from buffer with proper timing
-                while len(audio_buffer) >= bytes_per_frame:
-                    # Extract one frame
-                    frame_bytes = bytes(audio_buffer[:bytes_per_frame])
-                    audio_buffer = audio_buffer[bytes_per_frame:]
-                    
-                    # Create AudioFrame
-                    frame = AudioFrame.create(
-                        self.SAMPLE_RATE,
-                        self.NUM_CHANNELS,
-                        self.SAMPLES_PER_FRAME
-                    )
-                    
-                    # Copy PCM data into frame using numpy (proper way to handle memoryview)
-                    audio_samples = np.frombuffer(frame_bytes, dtype=np.int16)
-                    frame_samples = np.frombuffer(frame.data, dtype=np.int16)
-                    np.copyto(frame_samples[:len(audio_samples)], audio_samples)
-                    
-                    # Feed to source immediately (LiveKit handles internal buffering)
-                    await self.audio_source.capture_frame(frame)
-                    
-                    # Maintain frame rate timing based on actual elapsed time
-                    if last_frame_time is not None:
-                        current_time = asyncio.get_event_loop().time()
-                        elapsed = current_time - last_frame_time
-                        sleep_needed = frame_interval - elapsed
-                        if sleep_needed > 0:
-                            await asyncio.sleep(sleep_needed)
-                    
-                    last_frame_time = asyncio.get_event_loop().time()
+            # Process complete frames from the chunk
+            while len(audio_chunk) - offset >= bytes_per_frame:
+                batch.append(self._make_frame(audio_chunk, offset))
+                offset += bytes_per_frame
             
-            # Process remaining buffer (pad if needed)
-            if len(audio_buffer) > 0:
-                bytes_per_frame = self.SAMPLES_PER_FRAME * 2
-                # Pad with zeros to complete frame
-                padding_needed = bytes_per_frame - len(audio_buffer)
-                audio_buffer.extend(b'\x00' * padding_needed)
-                
-                frame = AudioFrame.create(
-                    self.SAMPLE_RATE,
-                    self.NUM_CHANNELS,
-                    self.SAMPLES_PER_FRAME
-                )
-                
-                # Copy PCM data into frame using numpy (proper way to handle memoryview)
-                audio_buffer_bytes = bytes(audio_buffer)
-                audio_samples = np.frombuffer(audio_buffer_bytes, dtype=np.int16)
-                frame_samples = np.frombuffer(frame.data, dtype=np.int16)
-                np.copyto(frame_samples[:len(audio_samples)], audio_samples)
-                
+            if offset < len(audio_chunk):
+                with memoryview(audio_chunk) as chunk_view:
+                    pending += chunk_view[offset:]
+            if batch:
+                yield batch
+        
+        # Process remaining bytes (the frame's unfilled tail is already silence)
+        if pending:
+            yield [self._make_frame(pending)]
+    
+    def _make_frame(self, pcm: Union[bytes, bytearray], offset: int = 0) -> AudioFrame:
+        """Copy up to one frame's worth of PCM bytes, starting at offset, into a new AudioFrame.
+        
+        New frames are zero-filled, so a short final frame needs no padding copy.
+        """
+        frame = AudioFrame.create(
+            self.SAMPLE_RATE,
+            self.NUM_CHANNELS,
+            self.SAMPLES_PER_FRAME
+        )
+        
+        # Copy straight into the frame's buffer; the views are released before
+        # returning so the caller can still resize pcm
+        frame_bytes = len(frame.data) * 2  # 2 bytes per sample (16-bit)
+        with memoryview(frame.data).cast("B") as dst, memoryview(pcm)[offset:offset + frame_bytes] as src:
+            dst[:len(src)] = src
+        return frame
+    
+    async def synthesize(self, text: str, cache: bool = False) -> List[AudioFrame]:
+        """Generate the full TTS audio for text without playing it.
+        
+        Runs the blocking ElevenLabs stream on a worker thread, so the next
+        utterance can be synthesized while the current one is playing. With
+        cache=True the frames are kept (LRU) and reused for the same text.
+        """
+        if cache and text in self._synth_cache:
+            self._synth_cache.move_to_end(text)
+            return self._synth_cache[text]
+        
+        frames = await asyncio.to_thread(lambda: list(self._frames(self._pcm_stream(text))))
+        
+        if cache:
+            self._synth_cache[text] = frames
+            if len(self._synth_cache) > self.SYNTH_CACHE_SIZE:
+                self._synth_cache.popitem(last=False)
+        return frames
+    
+    async def _stream_frames(self, text: str) -> AsyncIterator[AudioFrame]:
+        """Yield frames as the ElevenLabs stream arrives.
+        
+        The blocking stream is read on a worker thread that hands each chunk's
+        frames over as one batch through a bounded queue, so it never stalls the
+        event loop, drains network bursts as fast as they arrive, and can only run
+        CHUNK_QUEUE_SIZE chunks ahead of playback.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.CHUNK_QUEUE_SIZE)
+        stop = threading.Event()
+        
+        def produce():
+            try:
+                for batch in self._frame_batches(self._pcm_stream(text)):
+                    if stop.is_set():
+                        break
+                    # Blocks this thread while the queue is full
+                    asyncio.run_coroutine_threadsafe(queue.put(batch), loop).result()
+            finally:
+                asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+        
+        producer = loop.run_in_executor(None, produce)
+        try:
+            while (batch := await queue.get()) is not None:
+                for frame in batch:
+                    yield frame
+        finally:
+            # Unblock the producer if playback stopped early, then surface its errors
+            stop.set()
+            while not queue.empty():
+                queue.get_nowait()
+            await producer
+    
+    async def play(self, frames: Union[Iterable[AudioFrame], AsyncIterable[AudioFrame]]) -> None:
+        """Play audio frames to the room in real time. Blocks until playback completes."""
+        # Publish now if prepare() was never called (or failed)
+        if self.current_publication is None:
+            await self.prepare()
+        
+        try:
+            async for frame in _iterate(frames):
+                # No pacing here: capture_frame waits while the source's queue
+                # (SOURCE_QUEUE_MS) is full, so LiveKit sets the real-time cadence
                 await self.audio_source.capture_frame(frame)
             
             # Wait for all audio to finish playing
@@ -137,7 +224,17 @@ class VoiceAgent:
             print(f"   ✅ {self.name} finished speaking")
             
         except Exception as e:
-            print(f"   ❌ Error in {self.name}.speak(): {e}")
+            print(f"   ❌ Error in {self.name}.play(): {e}")
             import traceback
             traceback.print_exc()
             raise
+    
+    async def speak(self, text: str) -> None:
+        """Generate TTS audio and play it to the room. Blocks until playback completes."""
+        print(f"   🎤 {self.name} speaking: {text[:50]}...")
+        # Frames are produced as the ElevenLabs stream arrives
+        frames = self._stream_frames(text)
+        try:
+            await self.play(frames)
+        finally:
+            await frames.aclose()
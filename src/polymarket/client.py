@@ -1,8 +1,11 @@
-import requests
-import json
-from typing import List, Optional
-from pydantic import BaseModel
+import asyncio
+import aiohttp
+import time
+from functools import cached_property
+from typing import AbstractSet, Dict, List, Optional, Tuple
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from datetime import datetime
+from ..utils import fastjson
 
 class Market(BaseModel):
     id: str
@@ -17,66 +20,141 @@ class Market(BaseModel):
     category: Optional[str]
     token_ids: List[str]
     
-    @property
+    @cached_property
+    def short_question(self) -> str:
+        """Return truncated question for display (computed once per market)"""
+        if len(self.question) <= 50:
+            return self.question
+        return self.question[:47] + "..."
+    
+    @cached_property
     def formatted_odds(self) -> dict:
-        """Return odds as percentage strings"""
+        """Return odds as percentage strings (computed once per market)"""
         return {
             outcome: f"{price * 100:.1f}%"
             for outcome, price in zip(self.outcomes, self.outcome_prices)
         }
     
-    @property
+    @cached_property
     def formatted_volume(self) -> str:
-        """Return human-readable volume"""
+        """Return human-readable volume (computed once per market)"""
         if self.volume_24h >= 1_000_000:
             return f"${self.volume_24h / 1_000_000:.1f}M"
         elif self.volume_24h >= 1_000:
             return f"${self.volume_24h / 1_000:.1f}K"
         return f"${self.volume_24h:.0f}"
 
+_markets_adapter = TypeAdapter(List[Market])
+
+
+def _decode_list(raw) -> list:
+    """Decode one of the Gamma API's JSON-encoded list fields (None if malformed)"""
+    try:
+        return fastjson.loads(raw or "[]")
+    except ValueError:
+        return None
+
+
+def _normalize_market(m: dict) -> dict:
+    """Map a Gamma API market onto Market's field names, leaving validation to pydantic"""
+    return {
+        "id": m.get("id"),
+        "question": m.get("question"),
+        "slug": m.get("slug"),
+        "description": m.get("description", ""),
+        "outcomes": _decode_list(m.get("outcomes")),
+        # Prices arrive as numeric strings; pydantic coerces them to float
+        "outcome_prices": _decode_list(m.get("outcomePrices")),
+        "volume_24h": m.get("volume24hr", 0),
+        "liquidity": m.get("liquidityNum", 0),
+        "end_date": m.get("endDate"),
+        "category": m.get("category"),
+        "token_ids": _decode_list(m.get("clobTokenIds")),
+    }
+
+
+def _validate_markets(raw_markets: List[dict]) -> List[Market]:
+    """Validate every market in one pydantic-core call, dropping malformed ones"""
+    try:
+        return _markets_adapter.validate_python(raw_markets)
+    except ValidationError as e:
+        bad = {error["loc"][0] for error in e.errors()}
+        print(f"Error parsing {len(bad)} market(s): {e}")
+        return _markets_adapter.validate_python(
+            [m for i, m in enumerate(raw_markets) if i not in bad]
+        )
+
+
 class PolymarketClient:
     GAMMA_BASE = "https://gamma-api.polymarket.com"
     CLOB_BASE = "https://clob.polymarket.com"
+    TRENDING_CACHE_TTL = 30  # Seconds a trending-markets response is reused
+    TRENDING_FETCH_LIMIT = 30  # Smaller requests are rounded up so they share one fetch
+    REQUEST_TIMEOUT = 5  # Seconds per HTTP request
+    MAX_RETRIES = 3  # Retries on transient gateway errors
+    RETRY_BACKOFF = 0.2  # Seconds; doubled after each retry
+    RETRY_STATUSES = frozenset({502, 503, 504})
+    
+    def __init__(self):
+        # limit -> (fetched_at, markets)
+        self._trending_cache: Dict[int, Tuple[float, List[Market]]] = {}
+        # One keep-alive session so repeat fetches skip the TCP/TLS handshake;
+        # created on first use so it binds to the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                # Price lookups fan out to the same host, so allow a wider per-host pool
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
+            )
+        return self._session
     
-    def get_trending_markets(self, limit: int = 10) -> List[Market]:
-        """Fetch trending markets sorted by 24h volume"""
-        response = requests.get(
+    async def _get_json(self, url: str, params: dict):
+        """GET url and decode the JSON body, retrying transient gateway errors with backoff"""
+        for attempt in range(self.MAX_RETRIES + 1):
+            async with self._get_session().get(url, params=params) as response:
+                if response.status in self.RETRY_STATUSES and attempt < self.MAX_RETRIES:
+                    await asyncio.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+                    continue
+                response.raise_for_status()
+                return fastjson.loads(await response.read())
+    
+    async def close(self):
+        """Close pooled HTTP connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def get_trending_markets(self, limit: int = 10) -> List[Market]:
+        """Fetch trending markets sorted by 24h volume (cached for TRENDING_CACHE_TTL)"""
+        # Results are sorted by volume, so a fresh larger fetch also answers smaller limits
+        now = time.monotonic()
+        for cached_limit, (fetched_at, cached_markets) in self._trending_cache.items():
+            if cached_limit >= limit and now - fetched_at < self.TRENDING_CACHE_TTL:
+                return cached_markets[:limit]
+        
+        fetch_limit = max(limit, self.TRENDING_FETCH_LIMIT)
+        data = await self._get_json(
             f"{self.GAMMA_BASE}/markets",
             params={
                 "closed": "false",
                 "active": "true",
                 "order": "volume24hr",
                 "ascending": "false",
-                "limit": limit
+                "limit": fetch_limit
             }
         )
-        response.raise_for_status()
         
-        markets = []
-        for m in response.json():
-            try:
-                markets.append(Market(
-                    id=m["id"],
-                    question=m["question"],
-                    slug=m["slug"],
-                    description=m.get("description", ""),
-                    outcomes=json.loads(m.get("outcomes", "[]")),
-                    outcome_prices=[float(p) for p in json.loads(m.get("outcomePrices", "[]"))],
-                    volume_24h=float(m.get("volume24hr", 0)),
-                    liquidity=float(m.get("liquidityNum", 0)),
-                    end_date=m.get("endDate"),
-                    category=m.get("category"),
-                    token_ids=json.loads(m.get("clobTokenIds", "[]"))
-                ))
-            except Exception as e:
-                print(f"Error parsing market: {e}")
-                continue
+        markets = _validate_markets([_normalize_market(m) for m in data])
         
-        return markets
+        self._trending_cache[fetch_limit] = (time.monotonic(), markets)
+        return markets[:limit]
     
-    def get_candidate_markets(self, exclude_ids: List[str] = None) -> List[Market]:
+    async def get_candidate_markets(self, exclude_ids: Optional[AbstractSet[str]] = None) -> List[Market]:
         """Get 2 candidate markets for voting, excluding recently discussed ones"""
-        markets = self.get_trending_markets(limit=20)
+        markets = await self.get_trending_markets(limit=20)
         
         if exclude_ids:
             markets = [m for m in markets if m.id not in exclude_ids]
@@ -84,13 +162,17 @@ class PolymarketClient:
         # Return top 2 by volume
         return markets[:2]
     
-    def get_live_price(self, token_id: str) -> Optional[float]:
+    async def get_live_price(self, token_id: str) -> Optional[float]:
         """Get real-time price from CLOB API"""
         try:
-            response = requests.get(
+            data = await self._get_json(
                 f"{self.CLOB_BASE}/midpoint",
                 params={"token_id": token_id}
             )
-            return float(response.json().get("mid", 0))
+            return float(data.get("mid", 0))
         except:
-            return None
\ No newline at end of file
+            return None
+    
+    async def get_live_prices(self, token_ids: List[str]) -> List[Optional[float]]:
+        """Get real-time prices for several tokens concurrently (None where a lookup fails)"""
+        return await asyncio.gather(*(self.get_live_price(t) for t in token_ids))
\ No newline at end of file
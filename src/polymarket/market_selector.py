@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from typing import List, Optional, Tuple
 from .client import PolymarketClient
 from .models import Market, VotingCandidate
@@ -12,31 +13,35 @@ class MarketSelector:
     
     def __init__(self, client: Optional[PolymarketClient] = None):
         self.client = client or PolymarketClient()
-        self.discussed_market_ids: List[str] = []
+        # Insertion-ordered for eviction, with O(1) membership tests
+        self.discussed_market_ids: "OrderedDict[str, None]" = OrderedDict()
         self.max_history = 20  # Keep track of last 20 discussed markets
     
     def mark_as_discussed(self, market_id: str) -> None:
         """Mark a market as discussed to avoid repeating it"""
-        self.discussed_market_ids.append(market_id)
+        self.discussed_market_ids[market_id] = None
+        self.discussed_market_ids.move_to_end(market_id)
         # Keep only the most recent markets
-        if len(self.discussed_market_ids) > self.max_history:
-            self.discussed_market_ids = self.discussed_market_ids[-self.max_history:]
+        while len(self.discussed_market_ids) > self.max_history:
+            self.discussed_market_ids.popitem(last=False)
         logger.info(f"Marked market {market_id} as discussed")
     
+    def _undiscussed(self, markets: List[Market]) -> List[Market]:
+        """Markets not in the recent discussion history (O(1) lookup per market)"""
+        discussed = self.discussed_market_ids.keys()
+        return [m for m in markets if m.id not in discussed]
+    
     def clear_history(self) -> None:
         """Clear the discussion history"""
         self.discussed_market_ids.clear()
         logger.info("Cleared discussion history")
     
-    def get_voting_candidates(self) -> Tuple[VotingCandidate, VotingCandidate]:
+    async def get_voting_candidates(self) -> Tuple[VotingCandidate, VotingCandidate]:
         """Get 2 candidate markets for voting, excluding recently discussed ones"""
-        markets = self.client.get_trending_markets(limit=20)
+        markets = await self.client.get_trending_markets(limit=20)
         
         # Filter out recently discussed markets
-        available_markets = [
-            m for m in markets 
-            if m.id not in self.discussed_market_ids
-        ]
+        available_markets = self._undiscussed(markets)
         
         # If we've discussed too many, reset and use all
         if len(available_markets) < 2:
@@ -52,12 +57,12 @@ class MarketSelector:
             VotingCandidate.from_market(candidates[1], 2)
         )
     
-    def get_diverse_candidates(self) -> Tuple[VotingCandidate, VotingCandidate]:
+    async def get_diverse_candidates(self) -> Tuple[VotingCandidate, VotingCandidate]:
         """Get 2 candidate markets from different categories for variety"""
-        markets = self.client.get_trending_markets(limit=30)
+        markets = await self.client.get_trending_markets(limit=30)
         
         # Filter out recently discussed
-        available = [m for m in markets if m.id not in self.discussed_market_ids]
+        available = self._undiscussed(markets)
         
         if len(available) < 2:
             self.clear_history()
@@ -81,9 +86,9 @@ class MarketSelector:
             VotingCandidate.from_market(second, 2)
         )
     
-    def get_initial_market(self) -> Market:
+    async def get_initial_market(self) -> Market:
         """Get the first market to start the show with"""
-        markets = self.client.get_trending_markets(limit=5)
+        markets = await self.client.get_trending_markets(limit=5)
         
         if not markets:
             raise RuntimeError("Could not fetch any markets from Polymarket")
@@ -93,10 +98,10 @@ class MarketSelector:
         logger.info(f"Selected initial market: {market.question}")
         return market
     
-    def get_random_candidate(self) -> Market:
+    async def get_random_candidate(self) -> Market:
         """Get a random market from trending (for variety)"""
-        markets = self.client.get_trending_markets(limit=20)
-        available = [m for m in markets if m.id not in self.discussed_market_ids]
+        markets = await self.client.get_trending_markets(limit=20)
+        available = self._undiscussed(markets)
         
         if not available:
             self.clear_history()
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
+from functools import cached_property
 
 
 class MarketOutcome(BaseModel):
@@ -29,33 +30,33 @@ class Market(BaseModel):
     category: Optional[str] = None
     token_ids: List[str] = Field(default_factory=list)
     
-    @property
+    @cached_property
     def formatted_odds(self) -> dict:
-        """Return odds as percentage strings"""
+        """Return odds as percentage strings (computed once per market)"""
         return {
             outcome: f"{price * 100:.1f}%"
             for outcome, price in zip(self.outcomes, self.outcome_prices)
         }
     
-    @property
+    @cached_property
     def market_outcomes(self) -> List[MarketOutcome]:
-        """Get list of MarketOutcome objects"""
+        """Get list of MarketOutcome objects (computed once per market)"""
         outcomes = []
         for i, (name, price) in enumerate(zip(self.outcomes, self.outcome_prices)):
             token_id = self.token_ids[i] if i < len(self.token_ids) else None
             outcomes.append(MarketOutcome(name=name, price=price, token_id=token_id))
         return outcomes
     
-    @property
+    @cached_property
     def short_question(self) -> str:
-        """Return truncated question for display"""
+        """Return truncated question for display (computed once per market)"""
         if len(self.question) <= 50:
             return self.question
         return self.question[:47] + "..."
     
-    @property
+    @cached_property
     def formatted_volume(self) -> str:
-        """Return human-readable volume"""
+        """Return human-readable volume (computed once per market)"""
         if self.volume_24h >= 1_000_000:
             return f"${self.volume_24h / 1_000_000:.1f}M"
         elif self.volume_24h >= 1_000:
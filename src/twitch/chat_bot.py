@@ -98,7 +98,12 @@ class TwitchChatBot:
     
     async def countdown(self, seconds: int = 10) -> None:
         """Send a countdown in chat"""
-        for i in range(seconds, 0, -1):
-            if i <= 5 or i == 10:
-                await self.send_message(f"⏰ {i}...")
-            await asyncio.sleep(1)
\ No newline at end of file
+        # Sleep straight to each announced tick (10 and 5..1) instead of waking every second
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        ticks = [i for i in range(seconds, 0, -1) if i <= 5 or i == 10]
+        for i in ticks:
+            await asyncio.sleep(max(0, (seconds - i) - (loop.time() - start)))
+            await self.send_message(f"⏰ {i}...")
+        # Return once the full countdown has elapsed
+        await asyncio.sleep(max(0, seconds - (loop.time() - start)))
\ No newline at end of file
@@ -1,23 +1,42 @@
 import asyncio
-from collections import defaultdict
+import re
 from twitchio.ext import commands
 import os
 
+# Accept: !vote 1, !vote 2, or just "1", "2"
+VOTE_OPTIONS = {"1": 1, "2": 2, "!vote 1": 1, "!vote 2": 2}
+# Fallback for looser spellings such as "!VOTE   2" or "!vote 1 yes"
+VOTE_PATTERN = re.compile(r"\s*(?:!vote\s+([12])(?:\s|$)|([12])\s*$)", re.IGNORECASE)
+# Chat lines longer than this are skipped before parsing, so a vote with trailing
+# chatter only counts if the whole line fits ("!vote 1 let's go!" is 17 and is ignored)
+MAX_VOTE_LENGTH = 16
+COMMAND_PREFIX = "!"
+# Outgoing chat is queued and spaced out to stay under Twitch's 20 messages / 30s
+SEND_QUEUE_SIZE = 50
+SEND_INTERVAL = 1.6  # Seconds between messages
+
 class VotingBot(commands.Bot):
     def __init__(self):
+        channel_name = os.environ['TWITCH_CHANNEL_NAME']
         # TwitchIO v3.x requires bot_id (the numeric user ID of the bot account)
         super().__init__(
             token=os.environ['TWITCH_OAUTH_TOKEN'],
             client_id=os.environ['TWITCH_CLIENT_ID'],
             client_secret=os.environ['TWITCH_CLIENT_SECRET'],
             bot_id=os.environ.get('TWITCH_BOT_ID', ''),  # Bot's numeric user ID
-            prefix='!',
-            initial_channels=[os.environ['TWITCH_CHANNEL_NAME']]
+            prefix=COMMAND_PREFIX,
+            initial_channels=[channel_name]
         )
-        self.votes = {}  # user_id -> vote_option
+        self._channel_name = channel_name
+        self._channel_name_lower = channel_name.lower()
+        self.votes: dict[int, int] = {}  # user_id -> vote_option
+        self._vote_counts = {1: 0, 2: 0}  # vote_option -> count, kept in step with votes
         self.voting_open = False
         self.candidates = []  # List of candidate market names
+        self._open_msg = ""  # "Vote now" announcement for the current round
         self._channel = None  # Cached channel reference
+        self._send_queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self._sender_task: asyncio.Task = None
         
     async def event_ready(self):
         # Get bot username - try multiple attributes for compatibility
@@ -31,9 +50,18 @@ class VotingBot(commands.Bot):
         print(f'✅ Twitch bot connected as {bot_name}')
         
         # Cache the channel reference when bot is ready
-        self._channel = self._get_channel()
+        self._channel = self._resolve_channel()
         if self._channel:
             print(f'   ✅ Channel reference cached: {self._channel.name}')
+        
+        if self._sender_task is None:
+            self._sender_task = asyncio.create_task(self._send_loop())
+    
+    async def close(self):
+        if self._sender_task:
+            self._sender_task.cancel()
+            self._sender_task = None
+        await super().close()
     
     async def event_message(self, message):
         if message.echo:
@@ -44,43 +72,49 @@ class VotingBot(commands.Bot):
             self._channel = message.channel
             print(f'   ✅ Channel reference cached from message: {self._channel.name}')
         
-        if self.voting_open:
-            content = message.content.lower().strip()
+        content = message.content
+        if self.voting_open and len(content) <= MAX_VOTE_LENGTH:
+            # Exact spellings are a dict hit; only odd ones reach the regex
+            vote_option = VOTE_OPTIONS.get(content)
+            if vote_option is None:
+                match = VOTE_PATTERN.match(content)
+                if match:
+                    vote_option = VOTE_OPTIONS[match.group(1) or match.group(2)]
             
-            # Accept: !vote 1, !vote 2, or just "1", "2"
-            vote_option = None
-            if content.startswith('!vote '):
-                try:
-                    vote_option = int(content.split()[1])
-                except (ValueError, IndexError):
-                    pass
-            elif content in ['1', '2']:
-                try:
-                    vote_option = int(content)
-                except ValueError:
-                    pass
-            
-            if vote_option in [1, 2]:
-                self.votes[message.author.id] = vote_option
+            if vote_option is not None:
+                # Twitch user IDs are numeric; int keys hash and store cheaper than strings
+                self._record_vote(int(message.author.id), vote_option)
                 # Optional: acknowledge vote
                 # await message.channel.send(f"@{message.author.name} voted for option {vote_option}!")
         
-        await self.handle_commands(message)
+        # Plain chatter can't be a command, and votes aren't registered commands;
+        # only dispatch when there is something to dispatch to
+        if self.commands and content.startswith(COMMAND_PREFIX):
+            await self.handle_commands(message)
+    
+    def _record_vote(self, user_id: int, vote_option: int) -> None:
+        """Store a user's vote and update the running counts (a changed vote moves over)"""
+        previous = self.votes.get(user_id)
+        if previous == vote_option:
+            return
+        if previous is not None:
+            self._vote_counts[previous] -= 1
+        self.votes[user_id] = vote_option
+        self._vote_counts[vote_option] += 1
     
     def get_current_tally(self) -> dict:
         """Get current vote counts while voting is open"""
-        tally = defaultdict(int)
-        for vote in self.votes.values():
-            tally[vote] += 1
-        return dict(tally)
+        return dict(self._vote_counts)
     
     def _get_channel(self):
-        """Get the Twitch channel - try multiple methods for compatibility"""
-        # First, try cached channel reference
-        if self._channel:
-            return self._channel
-        
-        channel_name = os.environ['TWITCH_CHANNEL_NAME']
+        """Get the Twitch channel, resolving and caching it on first use"""
+        if self._channel is None:
+            self._channel = self._resolve_channel()
+        return self._channel
+    
+    def _resolve_channel(self):
+        """Look up the Twitch channel - try multiple methods for compatibility"""
+        channel_name = self._channel_name
         
         # Try different methods to get the channel
         # Method 1: connected_channels list (if it exists)
@@ -100,7 +134,7 @@ class VotingBot(commands.Bot):
         # Method 3: Try lowercase version
         if hasattr(self, 'get_channel'):
             try:
-                channel = self.get_channel(channel_name.lower())
+                channel = self.get_channel(self._channel_name_lower)
                 if channel:
                     return channel
             except:
@@ -111,7 +145,7 @@ class VotingBot(commands.Bot):
             try:
                 # channels might be a dict or list
                 if isinstance(self.channels, dict):
-                    return self.channels.get(channel_name) or self.channels.get(channel_name.lower())
+                    return self.channels.get(channel_name) or self.channels.get(self._channel_name_lower)
                 elif isinstance(self.channels, list) and self.channels:
                     return self.channels[0]
             except:
@@ -119,66 +153,72 @@ class VotingBot(commands.Bot):
         
         return None
     
+    async def _send_loop(self):
+        """Send queued chat messages one at a time, SEND_INTERVAL apart"""
+        while True:
+            message = await self._send_queue.get()
+            channel = self._get_channel()
+            if channel:
+                try:
+                    await channel.send(message)
+                except Exception as e:
+                    print(f"⚠️ Could not send chat message: {e}")
+            else:
+                print(f"⚠️ Could not get channel to send chat message")
+            await asyncio.sleep(SEND_INTERVAL)
+    
+    def _queue_message(self, message: str):
+        """Queue a chat message for the sender task; dropped if the queue is full"""
+        try:
+            self._send_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            print(f"⚠️ Chat send queue full, dropping message: {message[:50]}")
+    
     async def send_announcement(self, message: str):
         """Send a message to the Twitch channel"""
-        channel = self._get_channel()
-        if channel:
-            try:
-                await channel.send(message)
-            except Exception as e:
-                print(f"⚠️ Could not send announcement: {e}")
-        else:
-            print(f"⚠️ Could not get channel to send announcement")
+        self._queue_message(message)
     
     async def open_voting(self, candidates: list):
         """Start a voting round with 2 candidate markets"""
         self.votes.clear()
+        self._vote_counts = {1: 0, 2: 0}
         self.candidates = candidates
         self.voting_open = True
         
-        channel = self._get_channel()
-        if channel:
-            try:
-                await channel.send(
-                    f"🗳️ VOTE NOW! Type 1 or 2 in chat! "
-                    f"Option 1: {candidates[0]} | Option 2: {candidates[1]}"
-                )
-            except Exception as e:
-                print(f"⚠️ Could not send voting message: {e}")
-        else:
-            print(f"⚠️ Could not get channel to open voting (voting still active, votes will be collected)")
+        # Built once per round so reminders can resend it as-is
+        self._open_msg = (
+            f"🗳️ VOTE NOW! Type 1 or 2 in chat! "
+            f"Option 1: {candidates[0]} | Option 2: {candidates[1]}"
+        )
+        # Voting is active (and votes are collected) even if the message can't be sent
+        self._queue_message(self._open_msg)
+    
+    async def remind(self):
+        """Repeat the current round's "vote now" announcement while voting is open"""
+        if self.voting_open:
+            self._queue_message(self._open_msg)
     
     async def close_voting(self) -> dict:
         """End voting and return results"""
         self.voting_open = False
         
-        tally = defaultdict(int)
-        for vote in self.votes.values():
-            tally[vote] += 1
+        tally = dict(self._vote_counts)
         
         total = len(self.votes)
-        # Default to option 1 if no votes
-        if not tally:
-            winner = 1
-        else:
-            winner = max(tally.items(), key=lambda x: x[1])[0]
+        # Option 1 wins ties (including no votes at all)
+        winner = 1 if tally[1] >= tally[2] else 2
         
         result = {
             "winner": winner,
             "winner_market": self.candidates[winner - 1] if self.candidates else None,
-            "tally": dict(tally),
+            "tally": tally,
             "total_votes": total
         }
         
         # Announce results
-        channel = self._get_channel()
-        if channel:
-            try:
-                await channel.send(
-                    f"🏆 VOTING CLOSED! Winner: Option {winner} with {tally.get(winner, 0)} votes! "
-                    f"Total votes: {total}"
-                )
-            except Exception as e:
-                print(f"⚠️ Could not send voting results: {e}")
+        self._queue_message(
+            f"🏆 VOTING CLOSED! Winner: Option {winner} with {tally.get(winner, 0)} votes! "
+            f"Total votes: {total}"
+        )
         
         return result
\ No newline at end of file
@@ -1,26 +1,41 @@
 import os
+from operator import attrgetter
 from dataclasses import dataclass
-from dotenv import load_dotenv
-from typing import Optional
+from functools import lru_cache
+from .env import load_env
 
-load_dotenv()
+load_env()
 
+# (config attribute path, environment variable) pairs that must be non-empty
+REQUIRED_SETTINGS = (
+    ("livekit.url", "LIVEKIT_URL"),
+    ("livekit.api_key", "LIVEKIT_API_KEY"),
+    ("livekit.api_secret", "LIVEKIT_API_SECRET"),
+    ("elevenlabs.api_key", "ELEVEN_API_KEY"),
+    ("twitch.oauth_token", "TWITCH_OAUTH_TOKEN"),
+    ("twitch.channel_name", "TWITCH_CHANNEL_NAME"),
+    ("twitch.stream_key", "TWITCH_STREAM_KEY"),
+    ("openai_api_key", "OPENAI_API_KEY"),
+)
+# Getters are built once at import, not per validate() call
+_REQUIRED_CHECKS = tuple((attrgetter(path), f"{env} is required") for path, env in REQUIRED_SETTINGS)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class LiveKitConfig:
     url: str
     api_key: str
     api_secret: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ElevenLabsConfig:
     api_key: str
     host_1_voice_id: str
     host_2_voice_id: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TwitchConfig:
     client_id: str
     client_secret: str
@@ -29,14 +44,14 @@ class TwitchConfig:
     stream_key: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StreamConfig:
     discussion_duration: int
     voting_duration: int
     room_name: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     livekit: LiveKitConfig
     elevenlabs: ElevenLabsConfig
@@ -75,34 +90,10 @@ class Config:
     
     def validate(self) -> list[str]:
         """Validate that all required config values are present"""
-        errors = []
-        
-        if not self.livekit.url:
-            errors.append("LIVEKIT_URL is required")
-        if not self.livekit.api_key:
-            errors.append("LIVEKIT_API_KEY is required")
-        if not self.livekit.api_secret:
-            errors.append("LIVEKIT_API_SECRET is required")
-        if not self.elevenlabs.api_key:
-            errors.append("ELEVEN_API_KEY is required")
-        if not self.twitch.oauth_token:
-            errors.append("TWITCH_OAUTH_TOKEN is required")
-        if not self.twitch.channel_name:
-            errors.append("TWITCH_CHANNEL_NAME is required")
-        if not self.twitch.stream_key:
-            errors.append("TWITCH_STREAM_KEY is required")
-        if not self.openai_api_key:
-            errors.append("OPENAI_API_KEY is required")
-            
-        return errors
-
-
-_config: Optional[Config] = None
+        return [error for get, error in _REQUIRED_CHECKS if not get(self)]
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
-    """Get or create the global config instance"""
-    global _config
-    if _config is None:
-        _config = Config.from_env()
-    return _config
+    """Get or create the global config instance (read from the environment once)"""
+    return Config.from_env()
@@ -0,0 +1,19 @@
+"""Process-wide .env loading"""
+import os
+from dotenv import load_dotenv
+
+_env_loaded = False
+
+
+def load_env() -> None:
+    """Load .env into the environment once per process.
+
+    Skipped when ENV is set to anything other than "dev": production
+    deployments inject their environment directly, so there is no file to parse.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    if os.getenv("ENV", "dev") == "dev":
+        load_dotenv(override=False)
@@ -0,0 +1,19 @@
+"""JSON encode/decode helpers backed by orjson, falling back to the stdlib"""
+import json
+
+try:
+    import orjson
+
+    def dumps(obj) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    def dumps(obj) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    loads = json.loads
+
+__all__ = ["dumps", "loads"]
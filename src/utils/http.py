@@ -0,0 +1,37 @@
+import os
+from typing import Optional
+
+import httpx
+import openai
+from .env import load_env
+
+load_env()
+
+# Connection pool limits shared by every outbound HTTP client in the process
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=300,
+)
+
+_http_client: Optional[httpx.AsyncClient] = None
+_openai_client: Optional[openai.AsyncOpenAI] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the process-wide pooled HTTP client"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=10.0)
+    return _http_client
+
+
+def get_openai_client() -> openai.AsyncOpenAI:
+    """Get or create the process-wide OpenAI client"""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = openai.AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=get_http_client(),
+        )
+    return _openai_client
@@ -1,11 +1,33 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from typing import Optional
 
+# Background listener draining the log queue (set by setup_logging(queued=True))
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
 
-def setup_logging(level: int = logging.INFO, log_file: Optional[str] = None) -> None:
-    """Configure logging for the application"""
+
+def stop_logging() -> None:
+    """Flush queued log records and stop the background listener"""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def setup_logging(level: int = logging.INFO, log_file: Optional[str] = None, queued: bool = True) -> None:
+    """Configure logging for the application
+    
+    With queued=True, loggers only enqueue records; a QueueListener thread does
+    the formatting and stream writes, so logging never blocks the event loop.
+    """
     
     # Create formatter
     formatter = logging.Formatter(
@@ -18,17 +40,34 @@ def setup_logging(level: int = logging.INFO, log_file: Optional[str] = None) ->
     console_handler.setFormatter(formatter)
     console_handler.setLevel(level)
     
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(level)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # Optionally add file handler
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
         file_handler.setLevel(level)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # The format doesn't use thread/process fields, so skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    # Configure root logger
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    if queued:
+        global _listener, _queue_handler
+        stop_logging()  # Replace, rather than stack, a previous listener
+        log_queue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        _queue_handler = logging.handlers.QueueHandler(log_queue)
+        root_logger.addHandler(_queue_handler)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
     
     # Reduce noise from third-party libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -37,44 +76,47 @@ def setup_logging(level: int = logging.INFO, log_file: Optional[str] = None) ->
     logging.getLogger("websockets").setLevel(logging.WARNING)
 
 
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name"""
     return logging.getLogger(name)
 
 
-# Emoji-based status logging helpers
+# Emoji-based status logging helpers: method name -> (level, emoji)
+_STATUS_STYLES = {
+    "success": (logging.INFO, "✅"),
+    "error": (logging.ERROR, "❌"),
+    "warning": (logging.WARNING, "⚠️"),
+    "info": (logging.INFO, "ℹ️"),
+    "start": (logging.INFO, "🚀"),
+    "stop": (logging.INFO, "⏹️"),
+    "vote": (logging.INFO, "🗳️"),
+    "trophy": (logging.INFO, "🏆"),
+    "mic": (logging.INFO, "🎙️"),
+    "wave": (logging.INFO, "👋"),
+}
+
+
+def _status_method(name: str, level: int, emoji: str):
+    """Build a StatusLogger method that logs message at level behind emoji"""
+    fmt = f"{emoji} %s"
+    
+    def method(self, message: str) -> None:
+        self.logger.log(level, fmt, message)
+    
+    method.__name__ = method.__qualname__ = name
+    return method
+
+
 class StatusLogger:
-    """Helper for logging with status emojis"""
+    """Helper for logging with status emojis (one method per _STATUS_STYLES entry)"""
     
     def __init__(self, name: str):
         self.logger = get_logger(name)
-    
-    def success(self, message: str) -> None:
-        self.logger.info(f"✅ {message}")
-    
-    def error(self, message: str) -> None:
-        self.logger.error(f"❌ {message}")
-    
-    def warning(self, message: str) -> None:
-        self.logger.warning(f"⚠️ {message}")
-    
-    def info(self, message: str) -> None:
-        self.logger.info(f"ℹ️ {message}")
-    
-    def start(self, message: str) -> None:
-        self.logger.info(f"🚀 {message}")
-    
-    def stop(self, message: str) -> None:
-        self.logger.info(f"⏹️ {message}")
-    
-    def vote(self, message: str) -> None:
-        self.logger.info(f"🗳️ {message}")
-    
-    def trophy(self, message: str) -> None:
-        self.logger.info(f"🏆 {message}")
-    
-    def mic(self, message: str) -> None:
-        self.logger.info(f"🎙️ {message}")
-    
-    def wave(self, message: str) -> None:
-        self.logger.info(f"👋 {message}")
+
+
+for _name, (_level, _emoji) in _STATUS_STYLES.items():
+    setattr(StatusLogger, _name, _status_method(_name, _level, _emoji))
+del _name, _level, _emoji
@@ -0,0 +1,36 @@
+"""Event loop selection and health helpers"""
+
+import asyncio
+import time
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def install_uvloop() -> bool:
+    """Use uvloop as the asyncio event loop policy when it is available.
+
+    uvloop is not built for Windows, so this quietly keeps the default loop
+    there. Returns True if uvloop was installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
+
+
+async def watch_loop_lag(threshold: float = 0.015, interval: float = 0.1) -> None:
+    """Log a warning whenever the event loop wakes up more than threshold seconds late.
+
+    A late wakeup means something ran on the loop without yielding - long enough,
+    and it starves real-time work such as audio frame delivery. Run as a task.
+    """
+    while True:
+        expected = time.monotonic() + interval
+        await asyncio.sleep(interval)
+        lag = time.monotonic() - expected
+        if lag > threshold:
+            logger.warning(f"⚠️ Event loop blocked for ~{lag * 1000:.0f}ms")
@@ -4,17 +4,46 @@ Replaces Twitch chat voting with WebSocket-based voting from the website.
 """
 
 import asyncio
-import json
 import os
-from collections import defaultdict
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
+from typing import Dict, List, Optional, Set, Union
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import uvicorn
+from ..utils import fastjson
+from ..utils.loop import install_uvloop
+
+# Voting closes early once one option holds this share of at least EARLY_CLOSE_MIN_VOTES votes
+EARLY_CLOSE_SHARE = 0.7
+VOTE_OPTIONS = frozenset({1, 2})
+EARLY_CLOSE_MIN_VOTES = int(os.getenv("EARLY_CLOSE_MIN_VOTES", 20))
+VOTING_WINDOW = 60.0  # Default seconds a round accepts votes
+# Abuse limits: voters per round, and minimum seconds between one voter's votes
+MAX_VOTES_PER_ROUND = 100_000
+VOTE_MIN_INTERVAL = 0.1
+MAX_VOTE_BODY = 256  # Bytes; a vote is {"option": 1}
+# Comma-separated proxy addresses (e.g. the website's /api/vote server) whose X-Forwarded-For
+# is believed; a direct caller's header is ignored, since anyone can forge it
+TRUSTED_PROXIES = frozenset(
+    address.strip() for address in os.getenv("TRUSTED_PROXIES", "").split(",") if address.strip()
+)
+# A client that can't take a state message within this many seconds is dropped
+SEND_TIMEOUT = 5.0
+# State messages waiting per client; a slow client drops the oldest (each is a full state)
+CLIENT_QUEUE_SIZE = 4
+# State changes within this many seconds are sent to clients as one broadcast
+BROADCAST_DELAY = 0.05
+# Keepalive is done with protocol-level ping frames; a client silent this long after one is dropped
+WS_PING_INTERVAL = 20.0
+WS_PING_TIMEOUT = 20.0
+# Comma-separated origins allowed to call the server from a browser (e.g. the streaming site)
+CORS_ORIGINS = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()]
+# Browsers cache a preflight result this long (seconds; Chromium caps it at 2 hours)
+CORS_MAX_AGE = 7200
 
 
 class ShowPhase(str, Enum):
@@ -24,19 +53,27 @@ class ShowPhase(str, Enum):
     TRANSITION = "transition"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MarketInfo:
     """Market information for display"""
     id: str
     question: str
     odds: Dict[str, str]
     volume: str = ""
+    _dict: dict = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Built once per market; ShowState.to_dict() reuses it on every broadcast
+        object.__setattr__(
+            self, "_dict",
+            {"id": self.id, "question": self.question, "odds": self.odds, "volume": self.volume}
+        )
     
     def to_dict(self):
-        return asdict(self)
+        return self._dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowState:
     """Current state of the show"""
     phase: ShowPhase = ShowPhase.STARTING
@@ -61,6 +98,23 @@ class ShowState:
         }
 
 
+def _voter_ip(request: Request) -> str:
+    """The voter's IP: the socket peer, or for a trusted proxy, the address it forwarded.
+    
+    X-Forwarded-For is walked from the right (each hop appends), skipping trusted
+    proxies, so entries the voter wrote themselves are never used.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if peer not in TRUSTED_PROXIES:
+        return peer
+    forwarded_for = request.headers.get("x-forwarded-for", "")
+    for address in reversed(forwarded_for.split(",")):
+        address = address.strip()
+        if address and address not in TRUSTED_PROXIES:
+            return address
+    return peer
+
+
 class WebVotingServer:
     """
     WebSocket-based voting server for the streaming website.
@@ -71,12 +125,22 @@ class WebVotingServer:
         self.host = host
         self.port = port
         self.state = ShowState()
-        self.votes: Dict[str, int] = {}  # ip/session -> vote option
-        self.connected_clients: Set[WebSocket] = set()
+        # ip (str) or websocket id (int) -> vote option; 1 and 2 are shared int objects
+        self.votes: Dict[Union[str, int], int] = {}
+        self._last_vote_at: Dict[Union[str, int], float] = {}  # voter -> monotonic time of last vote
+        self.client_queues: Dict[WebSocket, asyncio.Queue] = {}  # Drained by one writer task each
         self.voting_open = False
         self.candidates: List[str] = []
+        self.early_close_event = asyncio.Event()  # Set once the current vote is decisive
         self._server_task: Optional[asyncio.Task] = None
         self._app: Optional[FastAPI] = None
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None  # Pending coalesced broadcast
+        self._deadline_handle: Optional[asyncio.TimerHandle] = None  # Stops the round's voting
+        self._dirty = False  # State changed since the last broadcast
+        self._tally_only = True  # ...and only vote_tally changed, so a "tally" message covers it
+        self._state_json: Optional[bytes] = None  # Encoded state, None once stale
+        self._state_message: Optional[str] = None  # Encoded "state" message wrapping it
         
     def _create_app(self) -> FastAPI:
         """Create FastAPI application"""
@@ -89,22 +153,25 @@ class WebVotingServer:
         
         app = FastAPI(
             title="Polymarket AI Stream - Voting Server",
-            lifespan=lifespan
+            lifespan=lifespan,
+            default_response_class=ORJSONResponse
         )
         
-        # CORS for website access
+        # CORS for website access; credentials are only allowed for pinned origins,
+        # since browsers reject them alongside a wildcard
         app.add_middleware(
             CORSMiddleware,
-            allow_origins=["*"],  # TODO: Restrict in production
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
+            allow_origins=CORS_ORIGINS,
+            allow_credentials="*" not in CORS_ORIGINS,
+            allow_methods=["GET", "POST"],
+            allow_headers=["Content-Type"],
+            max_age=CORS_MAX_AGE,
         )
         
         @app.get("/state")
         async def get_state():
             """Get current show state"""
-            return self.state.to_dict()
+            return Response(content=self._encoded_state(), media_type="application/json")
         
         @app.post("/vote")
         async def cast_vote(request: Request):
@@ -112,24 +179,31 @@ class WebVotingServer:
             if not self.voting_open:
                 return {"success": False, "error": "Voting is not open"}
             
+            # Refuse oversized bodies from the header alone, before reading them
+            content_length = request.headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > MAX_VOTE_BODY:
+                return {"success": False, "error": "too_large"}
+            
             try:
-                body = await request.json()
+                raw = await request.body()
+                if len(raw) > MAX_VOTE_BODY:
+                    return {"success": False, "error": "too_large"}
+                body = fastjson.loads(raw)
                 option = body.get("option")
                 
-                if option not in [1, 2]:
+                if option not in VOTE_OPTIONS:
                     return {"success": False, "error": "Invalid option. Use 1 or 2."}
                 
                 # Use IP for vote deduplication
-                client_ip = request.client.host if request.client else "unknown"
-                
-                # Record vote (overwrites previous)
-                self.votes[client_ip] = option
+                client_ip = _voter_ip(request)
                 
-                # Update tally
-                self._update_tally()
+                rejection = self._check_vote_limits(client_ip)
+                if rejection:
+                    return {"success": False, "error": rejection}
                 
-                # Broadcast update
-                await self._broadcast_state()
+                # Record vote (overwrites previous) and broadcast the update
+                if self._record_vote(client_ip, option):
+                    self._schedule_broadcast(tally_only=True)
                 
                 return {
                     "success": True,
@@ -145,74 +219,127 @@ class WebVotingServer:
         async def websocket_endpoint(websocket: WebSocket):
             """WebSocket connection for real-time updates"""
             await websocket.accept()
-            self.connected_clients.add(websocket)
             
             try:
-                # Send current state immediately
-                await websocket.send_json({
-                    "type": "state",
-                    "data": self.state.to_dict()
-                })
+                # All messages go through this client's queue and writer. The current
+                # state is queued in the same step that registers the client, so no
+                # broadcast can slip in between and be missed
+                send_queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+                send_queue.put_nowait(self._state_message_json())
+                self.client_queues[websocket] = send_queue
+                writer = asyncio.create_task(self._writer(websocket, send_queue))
+                self._background_tasks.add(writer)
+                writer.add_done_callback(self._background_tasks.discard)
                 
-                # Keep connection alive and handle incoming votes
+                # Handle incoming votes (uvicorn keeps the connection alive with ping frames)
                 while True:
-                    try:
-                        data = await asyncio.wait_for(
-                            websocket.receive_json(),
-                            timeout=30.0
-                        )
-                        
-                        if data.get("type") == "vote" and self.voting_open:
-                            option = data.get("option")
-                            if option in [1, 2]:
-                                # Use websocket id for dedup
-                                client_id = str(id(websocket))
-                                self.votes[client_id] = option
-                                self._update_tally()
-                                await self._broadcast_state()
-                                
-                        elif data.get("type") == "ping":
-                            await websocket.send_json({"type": "pong"})
-                            
-                    except asyncio.TimeoutError:
-                        # Send ping to keep connection alive
-                        await websocket.send_json({"type": "ping"})
+                    data = fastjson.loads(await websocket.receive_text())
+                    
+                    if data.get("type") == "vote" and self.voting_open:
+                        option = data.get("option")
+                        if option in VOTE_OPTIONS:
+                            # Use websocket id for dedup
+                            client_id = id(websocket)
+                            if not self._check_vote_limits(client_id) and self._record_vote(client_id, option):
+                                self._schedule_broadcast(tally_only=True)
                         
             except WebSocketDisconnect:
                 pass
             except Exception as e:
                 print(f"WebSocket error: {e}")
             finally:
-                self.connected_clients.discard(websocket)
+                if self.client_queues.pop(websocket, None) is not None:
+                    writer.cancel()
         
         return app
     
-    def _update_tally(self):
-        """Update vote tally from votes dict"""
-        tally = {1: 0, 2: 0}
-        for vote in self.votes.values():
-            tally[vote] = tally.get(vote, 0) + 1
-        self.state.vote_tally = tally
+    def _check_vote_limits(self, client_id: Union[str, int]) -> Optional[str]:
+        """Return why a vote from client_id is refused, or None (and note the vote time) if allowed"""
+        if client_id not in self.votes and len(self.votes) >= MAX_VOTES_PER_ROUND:
+            return "Voting is full for this round"
+        now = time.monotonic()
+        if now - self._last_vote_at.get(client_id, float("-inf")) < VOTE_MIN_INTERVAL:
+            return "rate_limited"
+        self._last_vote_at[client_id] = now
+        return None
     
-    async def _broadcast_state(self):
-        """Broadcast current state to all connected clients"""
-        if not self.connected_clients:
-            return
-            
-        message = json.dumps({
-            "type": "state",
-            "data": self.state.to_dict()
-        })
+    def _record_vote(self, client_id: Union[str, int], option: int) -> bool:
+        """Store a client's vote and update the tally in place; False if nothing changed"""
+        previous = self.votes.get(client_id)
+        if previous == option:
+            return False
+        tally = self.state.vote_tally
+        if previous is not None:
+            tally[previous] -= 1
+        self.votes[client_id] = option
+        tally[option] += 1
+        
+        total = len(self.votes)
+        if total >= EARLY_CLOSE_MIN_VOTES and max(tally.values()) / total > EARLY_CLOSE_SHARE:
+            self.early_close_event.set()
+        return True
+    
+    def _encoded_state(self) -> bytes:
+        """The current state as JSON, encoded once per change"""
+        if self._state_json is None:
+            self._state_json = fastjson.dumps(self.state.to_dict())
+        return self._state_json
+    
+    def _state_message_json(self) -> str:
+        """The current state wrapped as a "state" message, built once per change"""
+        if self._state_message is None:
+            # Sent as a text frame, which clients parse as JSON
+            self._state_message = (b'{"type":"state","data":' + self._encoded_state() + b"}").decode()
+        return self._state_message
+    
+    def _schedule_broadcast(self, tally_only: bool = False):
+        """Mark the state changed and broadcast it shortly, coalescing bursts of updates.
         
-        disconnected = set()
-        for ws in self.connected_clients:
+        tally_only=True means only vote_tally changed; unless something else changes
+        before the flush, clients then get a small "tally" message instead of the full state.
+        """
+        self._state_json = self._state_message = None
+        self._tally_only = self._tally_only and tally_only
+        self._dirty = True
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(BROADCAST_DELAY, self._flush_state)
+    
+    def _flush_state(self):
+        """Broadcast the state (or just the tally) if it changed since the last flush"""
+        self._flush_handle = None
+        if not self._dirty:
+            return
+        if self._tally_only:
+            message = fastjson.dumps({
+                "type": "tally",
+                "data": {"vote_tally": self.state.vote_tally}
+            }).decode()
+        else:
+            message = self._state_message_json()
+        self._dirty = False
+        self._tally_only = True
+        self._broadcast(message)
+    
+    def _broadcast(self, message: str):
+        """Queue a message for every connected client's writer task"""
+        for send_queue in self.client_queues.values():
+            if send_queue.full():
+                # Backed up: the full state supersedes everything pending, so send just that
+                while not send_queue.empty():
+                    send_queue.get_nowait()
+                send_queue.put_nowait(self._state_message_json())
+            else:
+                send_queue.put_nowait(message)
+    
+    async def _writer(self, ws: WebSocket, send_queue: asyncio.Queue):
+        """Send queued state messages to one client until it fails or disconnects"""
+        while True:
+            message = await send_queue.get()
             try:
-                await ws.send_text(message)
+                await asyncio.wait_for(ws.send_text(message), timeout=SEND_TIMEOUT)
             except Exception:
-                disconnected.add(ws)
-        
-        # Remove disconnected clients
-        self.connected_clients -= disconnected
+                self.client_queues.pop(ws, None)
+                return
     
     async def start(self):
         """Start the voting server in background"""
@@ -222,17 +349,31 @@ class WebVotingServer:
             self._app,
             host=self.host,
             port=self.port,
-            log_level="warning"
+            log_level="warning",
+            ws_ping_interval=WS_PING_INTERVAL,
+            ws_ping_timeout=WS_PING_TIMEOUT
         )
         server = uvicorn.Server(config)
         self._server_task = asyncio.create_task(server.serve())
         
-        # Wait a moment for server to start
-        await asyncio.sleep(0.5)
+        # Wait until uvicorn has bound its socket rather than for a fixed delay
+        await asyncio.wait_for(self._wait_until_started(server), timeout=10.0)
         print(f"✅ Voting server running at http://{self.host}:{self.port}")
     
+    async def _wait_until_started(self, server: uvicorn.Server):
+        """Poll uvicorn's started flag, failing if the server exits during startup"""
+        while not server.started:
+            if self._server_task.done():
+                self._server_task.result()  # Re-raise the startup error, if any
+                raise RuntimeError("Voting server exited during startup")
+            await asyncio.sleep(0.05)
+    
     async def stop(self):
         """Stop the voting server"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._cancel_deadline()
         if self._server_task:
             self._server_task.cancel()
             try:
@@ -246,21 +387,38 @@ class WebVotingServer:
         """Get current vote counts"""
         return dict(self.state.vote_tally)
     
-    async def open_voting(self, candidates: List[str]):
-        """Start a voting round with 2 candidate markets"""
+    async def open_voting(self, candidates: List[str], duration: float = VOTING_WINDOW):
+        """Start a voting round with 2 candidate markets, taking votes for duration seconds"""
         self.votes.clear()
+        self._last_vote_at.clear()
+        self.early_close_event.clear()
         self.candidates = candidates
         self.voting_open = True
         self.state.vote_tally = {1: 0, 2: 0}
         self.state.phase = ShowPhase.VOTING
-        self.state.voting_ends_at = asyncio.get_event_loop().time() + 60  # 60 seconds
+        self.state.voting_ends_at = time.time() + duration
+        
+        # One timer enforces the deadline server-side; close_voting still tallies the result
+        self._cancel_deadline()
+        self._deadline_handle = asyncio.get_running_loop().call_later(duration, self._stop_accepting_votes)
         
         print(f"🗳️ Voting opened: 1) {candidates[0][:40]}... | 2) {candidates[1][:40]}...")
         
-        await self._broadcast_state()
+        self._schedule_broadcast()
+    
+    def _stop_accepting_votes(self):
+        """Voting deadline reached: ignore further votes until the next round"""
+        self._deadline_handle = None
+        self.voting_open = False
+    
+    def _cancel_deadline(self):
+        if self._deadline_handle is not None:
+            self._deadline_handle.cancel()
+            self._deadline_handle = None
     
     async def close_voting(self) -> dict:
         """End voting and return results"""
+        self._cancel_deadline()
         self.voting_open = False
         self.state.phase = ShowPhase.TRANSITION
         self.state.voting_ends_at = None
@@ -285,7 +443,7 @@ class WebVotingServer:
         
         print(f"🏆 Voting closed! Winner: Option {winner} ({tally.get(winner, 0)} votes). Total: {total}")
         
-        await self._broadcast_state()
+        self._schedule_broadcast()
         
         return result
     
@@ -300,7 +458,7 @@ class WebVotingServer:
             volume=volume
         )
         self.state.phase = ShowPhase.DISCUSSION
-        await self._broadcast_state()
+        self._schedule_broadcast()
     
     async def update_candidates(self, candidates: List[dict]):
         """Update candidate markets for voting"""
@@ -313,17 +471,17 @@ class WebVotingServer:
             )
             for c in candidates
         ]
-        await self._broadcast_state()
+        self._schedule_broadcast()
     
     async def update_speaker(self, speaker: str):
         """Update which host is currently speaking"""
         self.state.current_speaker = speaker
-        await self._broadcast_state()
+        self._schedule_broadcast()
     
     async def increment_markets_discussed(self):
         """Increment the count of markets discussed"""
         self.state.markets_discussed += 1
-        await self._broadcast_state()
+        self._schedule_broadcast()
 
 
 # For standalone testing
@@ -339,4 +497,5 @@ if __name__ == "__main__":
         except KeyboardInterrupt:
             await server.stop()
     
+    install_uvloop()
     asyncio.run(main())
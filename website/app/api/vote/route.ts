@@ -9,7 +9,14 @@ export async function POST(request: NextRequest) {
         // Forward vote to Python voting server
         const response = await fetch(`${VOTING_SERVER_URL}/vote`, {
             method: "POST",
-            headers: { "Content-Type": "application/json" },
+            headers: {
+                "Content-Type": "application/json",
+                // The voting server dedupes and rate-limits by voter IP, not this proxy's.
+                // Append the caller's address, as each hop does; the server reads from the right
+                "X-Forwarded-For": [request.headers.get("x-forwarded-for"), request.ip]
+                    .filter(Boolean)
+                    .join(", "),
+            },
             body: JSON.stringify(body),
         });
 
@@ -96,6 +96,9 @@ export default function BloombergTerminal() {
                                 setSelectedVote(null);
                                 setHasVoted(false);
                             }
+                        } else if (message.type === "tally") {
+                            // Vote updates carry only the tally; merge it into the current state
+                            setState((prev) => ({ ...prev, ...message.data }));
                         }
                     } catch (e) {
                         console.error("Error parsing WebSocket message:", e);